@@ -6,10 +6,12 @@ import argparse
 from random import choice
 import cv2
 import requests
+from requests.adapters import HTTPAdapter
 from utils import (
     normalize_angle_deg,
     get_all_objects_info,
     draw_esp_overlay,
+    reserve_overlay_buffer,
     sync_vizdoom_ini,
 )
 import vizdoom as vzd
@@ -18,11 +20,18 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 import json
+import logging
+import queue
 import time
-from PIL import Image, ImageTk  # Add PIL
 import gc  # Explicit garbage collection management
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+# Larger first-generation threshold so short-lived per-frame objects are
+# freed by refcounting instead of triggering frequent young collections
+gc.set_threshold(70000, 10, 10)
+
 # Platform check for handling autorelease pool issues on macOS
 is_macos = sys.platform == "darwin"
 if is_macos:
@@ -33,55 +42,93 @@ if is_macos:
         pass
 
 
+# Player color name to ViZDoom colorset index
+COLOR_MAP = {
+    "Red": 0,
+    "Blue": 1,
+    "Green": 2,
+    "Yellow": 3,
+    "Purple": 4,
+    "Cyan": 5,
+    "White": 6,
+    "Gray": 7,
+}
+COLORS = list(COLOR_MAP)
+
+# Control buttons registered with the game
+_BUTTONS = (
+    vzd.Button.MOVE_FORWARD,
+    vzd.Button.MOVE_BACKWARD,
+    vzd.Button.MOVE_LEFT,
+    vzd.Button.MOVE_RIGHT,
+    vzd.Button.TURN_LEFT,
+    vzd.Button.TURN_RIGHT,
+    vzd.Button.ATTACK,
+    vzd.Button.USE,
+    vzd.Button.TURN_LEFT_RIGHT_DELTA,
+    vzd.Button.LOOK_UP_DOWN_DELTA,
+    vzd.Button.SELECT_NEXT_WEAPON,
+    vzd.Button.SELECT_PREV_WEAPON,
+    vzd.Button.SPEED,
+    vzd.Button.JUMP,
+    vzd.Button.CROUCH,
+)
+
+# Game variables exposed in the state
+_GAME_VARS = (
+    vzd.GameVariable.POSITION_X,
+    vzd.GameVariable.POSITION_Y,
+    vzd.GameVariable.POSITION_Z,
+    vzd.GameVariable.ANGLE,
+    vzd.GameVariable.PITCH,  # Add viewing angle needed for ESP functionality
+    vzd.GameVariable.HEALTH,
+    vzd.GameVariable.ARMOR,
+    vzd.GameVariable.SELECTED_WEAPON,
+    vzd.GameVariable.AMMO1,
+    vzd.GameVariable.AMMO2,
+    vzd.GameVariable.DEAD,
+    vzd.GameVariable.FRAGCOUNT,
+)
+
+
 def setup_input_controls(game):
     """Set up control buttons"""
     print("[INFO] Setting up control buttons...")
-    game.clear_available_buttons()
-
-    buttons = [
-        vzd.Button.MOVE_FORWARD,
-        vzd.Button.MOVE_BACKWARD,
-        vzd.Button.MOVE_LEFT,
-        vzd.Button.MOVE_RIGHT,
-        vzd.Button.TURN_LEFT,
-        vzd.Button.TURN_RIGHT,
-        vzd.Button.ATTACK,
-        vzd.Button.USE,
-        vzd.Button.TURN_LEFT_RIGHT_DELTA,
-        vzd.Button.LOOK_UP_DOWN_DELTA,
-        vzd.Button.SELECT_NEXT_WEAPON,
-        vzd.Button.SELECT_PREV_WEAPON,
-        vzd.Button.SPEED,
-        vzd.Button.JUMP,
-        vzd.Button.CROUCH,
-    ]
-
-    for button in buttons:
-        game.add_available_button(button)
+    # Replaces any buttons from the config in a single call
+    game.set_available_buttons(list(_BUTTONS))
 
 
 def setup_game_variables(game):
     """Set up game variables"""
     print("[INFO] Setting up game variables...")
-    game_variables = [
-        vzd.GameVariable.POSITION_X,
-        vzd.GameVariable.POSITION_Y,
-        vzd.GameVariable.POSITION_Z,
-        vzd.GameVariable.ANGLE,
-        vzd.GameVariable.PITCH,  # Add viewing angle needed for ESP functionality
-        vzd.GameVariable.HEALTH,
-        vzd.GameVariable.ARMOR,
-        vzd.GameVariable.SELECTED_WEAPON,
-        vzd.GameVariable.AMMO1,
-        vzd.GameVariable.AMMO2,
-        vzd.GameVariable.DEAD,
-        vzd.GameVariable.FRAGCOUNT,
-    ]
-
-    for var in game_variables:
+    for var in _GAME_VARS:
         game.add_available_game_variable(var)
 
 
+# Game variables read by the ESP loop, in unpacking order
+_ESP_VARS = (
+    vzd.GameVariable.POSITION_X,
+    vzd.GameVariable.POSITION_Y,
+    vzd.GameVariable.POSITION_Z,
+    vzd.GameVariable.ANGLE,
+    vzd.GameVariable.PITCH,
+)
+
+# Consecutive ESP drawing/display failures after which ESP is turned off
+_ESP_MAX_ERRORS = 30
+
+
+def esp_variable_indices(game):
+    """Positions of the ESP variables in state.game_variables
+
+    The order depends on the loaded config, which may declare variables
+    before setup_game_variables adds the rest, so it is looked up once
+    after init instead of being assumed.
+    """
+    available = game.get_available_game_variables()
+    return [available.index(var) for var in _ESP_VARS]
+
+
 def setup_object_info(game):
     """Set up object information"""
     game.set_objects_info_enabled(True)
@@ -96,78 +143,169 @@ def setup_automap(game):
     game.set_automap_render_textures(False)
 
 
-def normalize_angle_deg(deg):
-    """Normalize to -180~180 range"""
-    while deg > 180:
-        deg -= 360
-    while deg <= -180:
-        deg += 360
-    return deg
-
-
 class ESPOverlayWindow:
     """Tkinter window for displaying ESP overlay"""
 
-    def __init__(self, title="ViZDoom ESP Overlay", width=640, height=480):
+    def __init__(
+        self,
+        title="ViZDoom ESP Overlay",
+        width=640,
+        height=480,
+        refresh_ms=16,
+        drive_events=False,
+    ):
+        """
+        Args:
+            title: Window title
+            width: Window width
+            height: Window height
+            refresh_ms: Display refresh interval in milliseconds (~60 Hz)
+            drive_events: Pump Tk events from process_events when no mainloop
+                is running (command line mode)
+        """
         self.root = tk.Toplevel()
         self.root.title(title)
         self.root.geometry(f"{width}x{height}")
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        # Also mark the window closed when Tk destroys it some other way
+        # (e.g. with its parent), so is_open stays a plain flag readers can trust
+        self.root.bind("<Destroy>", self._on_destroy)
+        # Track minimize/hide so no ESP work is done for an unseen window
+        self.root.bind("<Map>", self._on_map)
+        self.root.bind("<Unmap>", self._on_unmap)
 
         self.canvas = tk.Canvas(self.root, width=width, height=height, bg="black")
         self.canvas.pack(fill=tk.BOTH, expand=True)
 
-        self.image_on_canvas = None
+        # One PhotoImage and canvas item reused for every frame
+        self.photo = tk.PhotoImage(master=self.root, width=width, height=height)
+        self.image_on_canvas = self.canvas.create_image(
+            0, 0, anchor=tk.NW, image=self.photo
+        )
         self.is_open = True
-        self.tk_images = []  # Store image references
+        self.is_visible = True
+
+        # (width, height) frames must have; ESPRenderWorker scales frames to
+        # it so the Tk thread never calls into OpenCV
+        self.display_size = (width, height)
+
+        # Preallocated binary PPM (P6) image: a constant header followed by
+        # the RGB pixels, which frames are copied into directly
+        header = f"P6 {width} {height} 255 ".encode()
+        self._ppm_buf = bytearray(len(header) + width * height * 3)
+        self._ppm_buf[: len(header)] = header
+        self._ppm_pixels = np.frombuffer(
+            self._ppm_buf, dtype=np.uint8, offset=len(header)
+        ).reshape(height, width, 3)
+
+        # Single-slot handoff from the game thread; newer frames overwrite
+        # older ones that were never displayed
+        self._frame_lock = threading.Lock()
+        self._latest_frame = [None]
+        self.refresh_ms = refresh_ms
+        self.drive_events = drive_events
+        # Earliest time process_events drains the Tk queue again
+        self._next_pump = 0.0
+        self._blit_error_count = 0
 
         # Bring window to front
         self.root.lift()
         self.root.attributes("-topmost", 1)
         self.root.attributes("-topmost", 0)
 
+        # Start the display refresh loop
+        self.root.after(self.refresh_ms, self._tick)
+
     def update_frame(self, frame):
-        """Display OpenCV frame in Tkinter window"""
+        """Hand an RGB frame of display_size to the window for the next refresh
+
+        Safe to call from any thread; no Tk calls are made here.
+        """
         if not self.is_open:
             return False
 
+        with self._frame_lock:
+            self._latest_frame[0] = frame
+        return True
+
+    def process_events(self):
+        """Pump Tk events when no mainloop is running (no-op otherwise)
+
+        Drains the queue at most once per refresh interval, so calling this
+        every game tic does not run a full Tk update per tic. Must be called
+        from the thread that created the window.
+        """
+        if not self.drive_events or not self.is_open:
+            return
+        now = time.monotonic()
+        if now < self._next_pump:
+            return
+        self._next_pump = now + self.refresh_ms / 1000.0
         try:
-            # Convert OpenCV BGR image to RGB
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            self.root.update()
+        except Exception as e:
+            print(f"[ERROR] Failed to update ESP window: {str(e)}")
 
-            # Convert NumPy array to PIL image
-            pil_image = Image.fromarray(rgb_frame)
+    def _tick(self):
+        """Display the most recent frame and reschedule at the refresh rate"""
+        if not self.is_open:
+            return
 
-            # Convert PIL image to Tkinter-compatible image
-            tk_image = ImageTk.PhotoImage(image=pil_image)
+        with self._frame_lock:
+            frame = self._latest_frame[0]
+            self._latest_frame[0] = None
 
-            # Store image reference (keep only the last 10)
-            self.tk_images.append(tk_image)
-            if len(self.tk_images) > 10:
-                self.tk_images.pop(0)
+        if frame is not None and self.is_visible:
+            self._blit(frame)
 
-            # Delete existing image if present
-            if self.image_on_canvas:
-                self.canvas.delete(self.image_on_canvas)
+        try:
+            self.root.after(self.refresh_ms, self._tick)
+        except Exception:
+            # Window was destroyed
+            pass
 
-            # Draw new image on canvas
-            self.image_on_canvas = self.canvas.create_image(
-                0, 0, anchor=tk.NW, image=tk_image
-            )
+    def _on_destroy(self, event):
+        """Clear is_open when the toplevel itself is destroyed"""
+        if event.widget is self.root:
+            self.is_open = False
 
-            # Update window
-            self.root.update()
-            return True
+    def _on_map(self, event):
+        """Resume drawing when the toplevel is shown again"""
+        if event.widget is self.root:
+            self.is_visible = True
+
+    def _on_unmap(self, event):
+        """Pause drawing while the toplevel is minimized or hidden"""
+        if event.widget is self.root:
+            self.is_visible = False
+
+    def _blit(self, frame):
+        """Copy a display-sized RGB frame into the PhotoImage"""
+        try:
+            # Frames are already RGB at the window size, so a plain copy
+            # into the PPM buffer is all the Tk thread does
+            np.copyto(self._ppm_pixels, frame)
+
+            # Blit into the existing PhotoImage; Tk decodes binary PPM directly
+            self.photo.configure(data=bytes(self._ppm_buf))
+            self._blit_error_count = 0
         except Exception as e:
-            print(f"[ERROR] Failed to update ESP frame: {str(e)}")
-            return False
+            self._blit_error_count += 1
+            if self._blit_error_count == 1:
+                logger.error("Failed to update ESP frame: %s", e)
+            if self._blit_error_count >= _ESP_MAX_ERRORS:
+                # Persistent failure - close the window so update_frame
+                # returns False and the game loop turns ESP off
+                logger.error("ESP display keeps failing, disabling ESP")
+                self.on_closing()
 
     def on_closing(self):
         """Handle window close event"""
         self.is_open = False
-        # Clear all image references
-        self.tk_images.clear()
+        # Clear image references
         self.image_on_canvas = None
+        with self._frame_lock:
+            self._latest_frame[0] = None
 
         try:
             # Clean up canvas
@@ -176,6 +314,160 @@ class ESPOverlayWindow:
             self.root.destroy()
         except:
             pass
+        self.photo = None
+
+
+class ESPRenderWorker:
+    """Background thread that draws the ESP overlay for the latest game frame
+
+    The game thread submits frames without blocking; a frame that has not
+    been drawn yet is replaced by the newer one, so ESP work never delays
+    the next game tick.
+    """
+
+    def __init__(self, esp_window, frame_shape=None):
+        """
+        Args:
+            esp_window: ESPOverlayWindow that displays the drawn frames
+            frame_shape: (height, width, channels) of the game frames; when
+                given, the overlay scratch buffer is allocated up front
+        """
+        if frame_shape is not None:
+            reserve_overlay_buffer(frame_shape)
+
+        self.esp_window = esp_window
+        self.is_running = True
+        self._queue = queue.Queue(maxsize=1)
+        self._error_count = 0
+        # Preallocated outputs for scaling frames to the window size, used
+        # alternately since the window may still be copying the previous one
+        self._scaled = None
+        self._scaled_index = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, frame, player_pos, angle_deg, pitch_deg, objects, frame_number):
+        """Queue a frame for drawing, dropping any frame not yet drawn"""
+        self._replace((frame, player_pos, angle_deg, pitch_deg, objects, frame_number))
+
+    def stop(self, timeout=1.0):
+        """Stop the worker thread"""
+        self.is_running = False
+        self._replace(None)
+        self._thread.join(timeout)
+
+    def _replace(self, item):
+        """Put item into the single-slot queue, discarding an older item"""
+        try:
+            self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            pass
+
+    def _run(self):
+        """Drawing loop"""
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                try:
+                    self._render(*item)
+                    self._error_count = 0
+                except Exception as e:
+                    self._error_count += 1
+                    if self._error_count == 1:
+                        logger.error("Error during ESP processing: %s", e)
+                    if self._error_count >= _ESP_MAX_ERRORS:
+                        # Persistent failure - stop; the game loop sees
+                        # is_running cleared and turns ESP off
+                        logger.error("ESP drawing keeps failing, disabling ESP")
+                        break
+                    # Display the frame without the overlay
+                    try:
+                        self._show(item[0])
+                    except Exception as e:
+                        logger.error("Failed to display ESP frame: %s", e)
+        finally:
+            # However the loop ends, tell the game loop no more frames are drawn
+            self.is_running = False
+
+    def _render(self, frame, player_pos, angle_deg, pitch_deg, objects, frame_number):
+        """Draw the overlay on frame and hand it to the ESP window"""
+        px, py, pz = player_pos
+
+        if objects is None:
+            # No object information - display original screen
+            if frame_number % 300 == 0:  # Print message every 300 frames
+                logger.warning(
+                    "Server does not provide object information, ESP feature not working."
+                )
+            self._show(frame)
+            return
+
+        # Detailed object dumps only when debug logging is on
+        debug_detail = logger.isEnabledFor(logging.DEBUG)
+        player_objects = get_all_objects_info(objects, px, py, debug_detail)
+
+        if not player_objects:
+            # No objects detected - display base frame
+            self._show(frame)
+            return
+
+        # Print detailed information when objects are detected
+        if debug_detail:
+            logger.debug("Detected player/enemy objects: %d", len(player_objects))
+
+            # Print detailed info for each object
+            for i, obj in enumerate(player_objects):
+                obj_name = obj.get("name", "Unknown")
+                obj_id = obj.get("id", -1)
+                obj_pos = obj.get("position", (0, 0, 0))
+                obj_dist = obj.get("distance", 0)
+                obj_health = obj.get("health", "N/A")
+                obj_dead = "Dead" if obj.get("is_dead", False) else "Alive"
+
+                logger.debug(
+                    "Object #%d: ID=%s, name=%s, position=%s, distance=%.1f, HP=%s, status=%s",
+                    i + 1,
+                    obj_id,
+                    obj_name,
+                    obj_pos,
+                    obj_dist,
+                    obj_health,
+                    obj_dead,
+                )
+
+        # Apply ESP overlay
+        frame_with_esp = draw_esp_overlay(
+            frame,
+            (px, py, pz),
+            normalize_angle_deg(angle_deg),
+            pitch_deg,
+            player_objects,
+        )
+        self._show(frame_with_esp)
+
+    def _show(self, frame):
+        """Display frame in the ESP window; stop when the window is gone"""
+        # Scale to the window size here rather than in the Tk refresh tick
+        width, height = self.esp_window.display_size
+        if frame.shape[:2] != (height, width):
+            shape = (height, width) + frame.shape[2:]
+            if self._scaled is None or self._scaled[0].shape != shape:
+                self._scaled = [np.empty(shape, dtype=np.uint8) for _ in range(2)]
+            dst = self._scaled[self._scaled_index]
+            self._scaled_index ^= 1
+            cv2.resize(
+                frame, (width, height), dst=dst, interpolation=cv2.INTER_NEAREST
+            )
+            frame = dst
+        if not self.esp_window.update_frame(frame):
+            # Update failed - deactivate ESP
+            self.is_running = False
 
 
 class ServerConnectionGUI:
@@ -189,6 +481,12 @@ class ServerConnectionGUI:
         self.is_connected = False
         self.esp_window = None  # Store ESP window reference
 
+        # Persistent HTTP session so repeated refreshes reuse the connection
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+
         # GUI setup
         self.root.title("ViZDoom Client Connection")
         self.root.geometry("600x650")  # Increase window size to accommodate new button
@@ -317,9 +615,7 @@ class ServerConnectionGUI:
         # Use OptionMenu instead of combobox
         self.color_var = tk.StringVar(self.color_frame)
         self.color_var.set("Blue")  # Default value
-        colors = ["Red", "Blue", "Green", "Yellow", "Purple", "Cyan", "White", "Gray"]
-
-        self.color_menu = tk.OptionMenu(self.color_frame, self.color_var, *colors)
+        self.color_menu = tk.OptionMenu(self.color_frame, self.color_var, *COLORS)
         self.color_menu.config(
             font=("Arial", 11),
             bg="#ffffff",
@@ -407,33 +703,35 @@ class ServerConnectionGUI:
 
     def _fetch_servers(self):
         """Background load of server list"""
+        error_msg = None
         try:
             # Add timeout to prevent response delay
-            response = requests.get(f"{self.dashboard_url}/api/servers", timeout=5)
+            response = self._http.get(f"{self.dashboard_url}/api/servers", timeout=5)
             if response.status_code == 200:
                 self.servers = response.json().get("servers", [])
-
-                # Update UI (execute in main thread)
-                self.root.after(0, self._update_server_list)
             else:
                 # Update UI on API error
                 error_msg = f"Failed to load server list: HTTP {response.status_code}"
-                self.root.after(
-                    0, lambda msg=error_msg: self.status_label.config(text=msg)
-                )
         except requests.exceptions.ConnectionError:
             error_msg = f"Connection failed: Cannot connect to {self.dashboard_url}"
-            self.root.after(0, lambda msg=error_msg: self.status_label.config(text=msg))
         except requests.exceptions.Timeout:
             error_msg = "Connection timeout: Response took too long"
-            self.root.after(0, lambda msg=error_msg: self.status_label.config(text=msg))
         except Exception as e:
             # Update UI on exception
             error_msg = f"Failed to load server list: {str(e)}"
-            self.root.after(0, lambda msg=error_msg: self.status_label.config(text=msg))
+
+        # Apply all UI updates in one main-thread callback
+        self.root.after(0, self._apply_fetch_result, error_msg)
+
+    def _apply_fetch_result(self, error_msg=None):
+        """Show fetched servers or the fetch error, then restore the button"""
+        if error_msg is None:
+            self._update_server_list()
+        else:
+            self.status_label.config(text=error_msg)
 
         # Restore button state
-        self.root.after(0, lambda: self.refresh_button.config(state=tk.NORMAL))
+        self.refresh_button.config(state=tk.NORMAL)
 
     def _update_server_list(self):
         """Display server list in listbox"""
@@ -441,15 +739,19 @@ class ServerConnectionGUI:
             self.status_label.config(text="No servers available.")
             return
 
-        # Add servers to listbox
+        # Add all servers to listbox in a single insert
+        display_texts = []
         for server in self.servers:
             status = "Running" if server["status"] == "running" else server["status"]
-            display_text = f"{server['name']} - Port: {server['port']} - Players: {server.get('connected_players', 0)}/{server['players']} - {status}"
-            self.server_list.insert(tk.END, display_text)
+            display_texts.append(
+                f"{server['name']} - Port: {server['port']} - Players: {server.get('connected_players', 0)}/{server['players']} - {status}"
+            )
+        self.server_list.insert(tk.END, *display_texts)
 
-            # Display running servers in different color
+        # Display running servers in different color
+        for idx, server in enumerate(self.servers):
             if server["status"] == "running":
-                self.server_list.itemconfig(tk.END, {"bg": "#ddffdd", "fg": "#000000"})
+                self.server_list.itemconfig(idx, {"bg": "#ddffdd", "fg": "#000000"})
 
         # Update status
         self.status_label.config(text=f"Available servers: {len(self.servers)}")
@@ -495,17 +797,7 @@ class ServerConnectionGUI:
             player_name += "-ESP"
 
         # Color number conversion
-        color_map = {
-            "Red": 0,
-            "Blue": 1,
-            "Green": 2,
-            "Yellow": 3,
-            "Purple": 4,
-            "Cyan": 5,
-            "White": 6,
-            "Gray": 7,
-        }
-        player_color = color_map.get(self.color_var.get(), 1)  # Default to blue
+        player_color = COLOR_MAP.get(self.color_var.get(), 1)  # Default to blue
 
         # Save connection info
         # Extract host from URL (remove http:// or https://)
@@ -592,17 +884,7 @@ class ServerConnectionGUI:
             player_name += "-ESP"
 
         # Color number conversion
-        color_map = {
-            "Red": 0,
-            "Blue": 1,
-            "Green": 2,
-            "Yellow": 3,
-            "Purple": 4,
-            "Cyan": 5,
-            "White": 6,
-            "Gray": 7,
-        }
-        player_color = color_map.get(self.color_var.get(), 1)  # Default to blue
+        player_color = COLOR_MAP.get(self.color_var.get(), 1)  # Default to blue
 
         self.status_label.config(text="ini file sync...")
 
@@ -638,6 +920,44 @@ class ServerConnectionGUI:
         self.game_thread.start()
 
 
+def _teardown_esp(esp_window, esp_worker, gui_instance=None):
+    """Stop the ESP worker and close its window"""
+    # Stop the overlay worker before closing its window
+    if esp_worker is not None:
+        esp_worker.stop()
+
+    if esp_window is None:
+        return
+
+    try:
+        # Close in GUI thread for resource cleanup
+        if (
+            gui_instance is not None
+            and hasattr(gui_instance, "root")
+            and gui_instance.root.winfo_exists()
+        ):
+            # Remove GUI reference
+            if hasattr(gui_instance, "esp_window"):
+                gui_instance.esp_window = None
+
+            # Execute window closing in GUI thread and wait until it has run
+            closed = threading.Event()
+
+            def close_window():
+                try:
+                    esp_window.on_closing()
+                finally:
+                    closed.set()
+
+            gui_instance.root.after(0, close_window)
+            closed.wait(timeout=1.0)
+        else:
+            # Close window directly
+            esp_window.on_closing()
+    except Exception as e:
+        print(f"[WARN] Failed to close ESP window: {str(e)}")
+
+
 def player_client(
     host_address="127.0.0.1",
     port=5029,
@@ -662,28 +982,31 @@ def player_client(
         gui_instance: ServerConnectionGUI instance for callbacks
     """
 
+    # Sync the ini file in the background while the game is configured
     print("[INFO] ini file sync...")
-    sync_vizdoom_ini()
+    ini_sync = threading.Thread(target=sync_vizdoom_ini, daemon=True)
+    ini_sync.start()
 
     # Initialize the game
     game = vzd.DoomGame()
     game_initialized = False
     esp_enabled = False  # Track ESP activation
     esp_window = None  # Tkinter window instance
-
-    # Additional protection for autorelease pool on macOS
-    if is_macos:
-        try:
-            # Call gc at the point of direct resource use
-            gc.collect()
-        except:
-            pass
+    esp_worker = None  # Background overlay drawing thread
+    gc_frozen = False  # Set once the collector is frozen after init
+    gc_disabled = False  # Whether this call disabled the collector
 
     # Explicitly specify OpenCV backend (QT may be more stable on macOS)
     # If OpenCV package is compiled with QT support
     try:
-        # Most stable backend on macOS
-        cv2.setNumThreads(1)  # Limit multithreading for improved stability
+        # Make sure OpenCV's SIMD code paths are enabled
+        cv2.setUseOptimized(True)
+        # Let OpenCV parallelize resize/color loops; keep the single-thread
+        # setting only on macOS where it was added for Tk/Obj-C stability
+        if not is_macos:
+            cv2.setNumThreads(0)  # 0 = OpenCV picks the thread count
+        else:
+            cv2.setNumThreads(1)
         # Remove previous Qt environment variable setting
         if "QT_QPA_PLATFORM" in os.environ:
             del os.environ["QT_QPA_PLATFORM"]
@@ -694,29 +1017,40 @@ def player_client(
     game.load_config("cig.cfg")
     game.set_mode(vzd.Mode.ASYNC_SPECTATOR)
 
+    # Request (height, width, channels) RGB frames so neither the ESP loop
+    # nor the ESP window needs a transpose or color conversion (cig.cfg
+    # defaults to CRCGCB)
+    game.set_screen_format(vzd.ScreenFormat.RGB24)
+
     # Set window visibility
     game.set_window_visible(window_visible)
 
-    # Join the specified host
-    game.add_game_args(f"-join {host_address}:{port}")
-
-    # Set player name and color
-    game.add_game_args(f"+name {name} +colorset {color}")
+    # Engine arguments, passed in a single call
+    game_args = [
+        f"-join {host_address}:{port}",  # Join the specified host
+        f"+name {name} +colorset {color}",  # Set player name and color
+        f"+timelimit {episode_timeout}",  # Additional game settings
+        "+freelook 1",  # Add mouse input setting
+    ]
+    game.add_game_args(" ".join(game_args))
 
-    # Additional game settings
-    game.add_game_args(f"+timelimit {episode_timeout}")
     setup_input_controls(game)
-    # Add mouse input setting
-    game.add_game_args("+freelook 1")
     setup_game_variables(game)
 
     # Initialize the game first, create ESP after game initialization
     try:
         print(f"Connecting to host at {host_address}:{port}...")
+        ini_sync.join()  # game.init() reads _vizdoom.ini
         game.init()
         game_initialized = True
         print(f"Connected as {name}")
 
+        # The single freeze point: move import-time objects and the
+        # long-lived game objects created by init out of the collector's
+        # generations so later collections do not rescan them
+        gc.freeze()
+        gc_frozen = True
+
         setup_object_info(game)
         setup_automap(game)
 
@@ -725,9 +1059,17 @@ def player_client(
             try:
                 # Create Tkinter ESP window
                 esp_window = ESPOverlayWindow(
-                    title=f"ViZDoom ESP Overlay - {name}", width=800, height=600
+                    title=f"ViZDoom ESP Overlay - {name}",
+                    width=800,
+                    height=600,
+                    drive_events=gui_instance is None,
                 )
                 esp_enabled = True
+                # Draw the overlay off the game thread
+                esp_worker = ESPRenderWorker(
+                    esp_window,
+                    (game.get_screen_height(), game.get_screen_width(), 3),
+                )
                 # Store ESP window reference in GUI instance
                 if gui_instance is not None:
                     gui_instance.esp_window = esp_window
@@ -744,132 +1086,93 @@ def player_client(
     try:
         print("Starting game loop...")
 
-        while not game.is_episode_finished():
+        # Whether states carry an objects attribute; the schema is fixed for
+        # the whole game, so it is probed once on the first state
+        has_objects_attr = None
+
+        # Bound methods used every tic, looked up once
+        is_episode_finished = game.is_episode_finished
+        is_player_dead = game.is_player_dead
+        advance_action = game.advance_action
+        get_state = game.get_state
+
+        # Player position and view angles are read from the state's
+        # game_variables array in one indexing operation
+        esp_var_idx = esp_variable_indices(game) if esp_worker is not None else None
+
+        # Cleared once the ESP window closes or the worker stops, so later
+        # tics skip ESP with a single local check
+        esp_active = esp_worker is not None
+
+        # The loop allocates nothing long-lived, so skip cyclic collections
+        # until the game ends; refcounting still frees per-frame objects.
+        # gc.disable() is process-wide, so only do this in command line mode:
+        # with the GUI this loop runs on a background thread while the Tk
+        # main thread keeps running
+        if gui_instance is None and gc.isenabled():
+            gc.disable()
+            gc_disabled = True
+
+        while not is_episode_finished():
             # Respawn if dead
-            if game.is_player_dead():
+            if is_player_dead():
                 game.respawn_player()
 
             # Get the state
-            game.advance_action()
-            state = game.get_state()
+            advance_action()
+            state = get_state()
 
             if state is None:
                 continue
 
-            if esp_enabled and esp_window is not None and esp_window.is_open:
+            if has_objects_attr is None:
+                has_objects_attr = hasattr(state, "objects")
+
+            if esp_active:
+                if not esp_window.is_open or not esp_worker.is_running:
+                    # Window closed or the worker gave up - stop ESP for this game
+                    # and close the window so it is not left mapped but unpumped
+                    esp_active = False
+                    esp_enabled = False
+                    _teardown_esp(esp_window, esp_worker, gui_instance)
+                    continue
+                if not esp_window.is_visible:
+                    # Window minimized or hidden - skip all ESP work
+                    esp_window.process_events()
+                    continue
                 try:
-                    print("[INFO] ESP overlay is activated.")
-                    px = game.get_game_variable(vzd.GameVariable.POSITION_X)
-                    py = game.get_game_variable(vzd.GameVariable.POSITION_Y)
-                    pz = game.get_game_variable(vzd.GameVariable.POSITION_Z)
-                    angle_deg = game.get_game_variable(vzd.GameVariable.ANGLE)
-                    pitch_deg = game.get_game_variable(vzd.GameVariable.PITCH)
-                    print(
-                        f"[INFO] Player position: {px}, {py}, {pz}, angle: {angle_deg}, pitch: {pitch_deg}"
+                    px, py, pz, angle_deg, pitch_deg = state.game_variables[
+                        esp_var_idx
+                    ].tolist()
+                    logger.debug(
+                        "Player position: %s, %s, %s, angle: %s, pitch: %s",
+                        px,
+                        py,
+                        pz,
+                        angle_deg,
+                        pitch_deg,
                     )
-                    angle_deg_norm = normalize_angle_deg(angle_deg)
 
                     if state.screen_buffer is None:
-                        print("[WARN] Screen buffer is None.")
+                        if state.number % 300 == 0:
+                            logger.warning("Screen buffer is None.")
                         continue
 
-                    screen_buf = state.screen_buffer
-
-                    if (
-                        len(screen_buf.shape) == 3
-                    ):  # Possible (channels, height, width) format
-                        # Check each dimension size
-                        if screen_buf.shape[0] == 3:  # (channels, height, width)
-                            screen_buf = np.transpose(screen_buf, (1, 2, 0))
-                        elif (
-                            screen_buf.shape[2] == 3
-                        ):  # Already (height, width, channels) format
-                            pass  # No conversion needed
-                        else:  # (width, height, channels) or other format
-                            screen_buf = np.transpose(screen_buf, (1, 0, 2))
-
-                    print(
-                        f"[INFO] Screen buffer shape after conversion: {screen_buf.shape}"
+                    # Screen format is RGB24, so the buffer is already (H, W, 3) RGB.
+                    # Each state owns a fresh buffer, so the worker draws the
+                    # overlay on it in place without an extra copy.
+                    objects = state.objects if has_objects_attr else None
+                    esp_worker.submit(
+                        state.screen_buffer,
+                        (px, py, pz),
+                        angle_deg,
+                        pitch_deg,
+                        objects,
+                        state.number,
                     )
-                    frame = cv2.cvtColor(screen_buf, cv2.COLOR_RGB2BGR)
-
-                    # Get object information
-                    player_objects = []
-                    has_object_info = (
-                        hasattr(state, "objects") and state.objects is not None
-                    )
-                    print(f"[INFO] Getting object information: {has_object_info}")
-
-                    if has_object_info:
-                        # Print detailed debug info only in first frame
-                        debug_detail = 1
-                        player_objects = get_all_objects_info(
-                            state.objects, px, py, debug_detail
-                        )
-
-                        # Print detailed information when objects are detected
-                        if player_objects:
-                            print(
-                                f"[DEBUG] Detected player/enemy objects: {len(player_objects)}"
-                            )
-
-                            # Print detailed info for each object
-                            for i, obj in enumerate(player_objects):
-                                obj_name = obj.get("name", "Unknown")
-                                obj_id = obj.get("id", -1)
-                                obj_pos = obj.get("position", (0, 0, 0))
-                                obj_dist = obj.get("distance", 0)
-                                obj_health = obj.get("health", "N/A")
-                                obj_dead = (
-                                    "Dead" if obj.get("is_dead", False) else "Alive"
-                                )
-
-                                print(
-                                    f"[DEBUG] Object #{i+1}: ID={obj_id}, name={obj_name}, position={obj_pos}, distance={obj_dist:.1f}, HP={obj_health}, status={obj_dead}"
-                                )
-
-                            # Apply ESP overlay
-                            try:
-                                frame_with_esp = draw_esp_overlay(
-                                    frame.copy(),
-                                    (px, py, pz),
-                                    angle_deg_norm,
-                                    pitch_deg,
-                                    player_objects,
-                                )
-
-                                # Display ESP frame in Tkinter window
-                                if not esp_window.update_frame(frame_with_esp):
-                                    # Update failed - deactivate ESP
-                                    esp_enabled = False
-
-                            except Exception as e:
-                                print(
-                                    f"[ERROR] ESP overlay application error: {str(e)}"
-                                )
-                                # Display base frame on error
-                                try:
-                                    esp_window.update_frame(frame)
-                                except:
-                                    pass
-                        else:
-                            # No objects detected - display base frame
-                            try:
-                                esp_window.update_frame(frame)
-                            except:
-                                pass
-                    else:
-                        # No object information - display original screen
-                        if state.number % 300 == 0:  # Print message every 300 frames
-                            print(
-                                "[WARN] Server does not provide object information, ESP feature not working."
-                            )
-                        try:
-                            esp_window.update_frame(frame)
-                        except:
-                            pass
+                    esp_window.process_events()
                 except Exception as e:
-                    print(f"[ERROR] Error during ESP processing: {str(e)}")
+                    logger.error("Error during ESP processing: %s", e)
 
     except KeyboardInterrupt:
         print("\nInterrupted by user")
@@ -881,38 +1184,10 @@ def player_client(
         # Game finished
         print("Game finished!")
 
-        # Additional cleanup on macOS
-        if is_macos:
-            try:
-                # Call gc at the point of direct resource release
-                gc.collect()
-            except:
-                pass
-
         # Close ESP window first
-        if esp_enabled and esp_window is not None:
-            try:
-                # Close in GUI thread for resource cleanup
-                if (
-                    gui_instance is not None
-                    and hasattr(gui_instance, "root")
-                    and gui_instance.root.winfo_exists()
-                ):
-                    # Remove GUI reference
-                    if hasattr(gui_instance, "esp_window"):
-                        gui_instance.esp_window = None
-
-                    # Execute window closing in GUI thread
-                    gui_instance.root.after(0, esp_window.on_closing)
-                    time.sleep(0.2)  # Allow time for window to close
-                else:
-                    # Close window directly
-                    esp_window.on_closing()
-
-                # Remove reference
-                esp_window = None
-            except Exception as e:
-                print(f"[WARN] Failed to close ESP window: {str(e)}")
+        if esp_enabled:
+            _teardown_esp(esp_window, esp_worker, gui_instance)
+        esp_window = esp_worker = None
 
         # Game cleanup next
         try:
@@ -937,14 +1212,15 @@ def player_client(
 
         print("Connection closed")
 
-        # Memory cleanup (call twice to handle circular references)
-        gc.collect()
-        time.sleep(0.1)  # Allow time for GC work to complete
+        # Memory cleanup (a full collection also handles circular references);
+        # re-enable the collector if the game loop disabled it and unfreeze
+        # first so the game objects frozen after init can be reclaimed
+        if gc_disabled:
+            gc.enable()
+        if gc_frozen:
+            gc.unfreeze()
         gc.collect()
 
-        # Explicitly set to None to decrease reference count
-        esp_window = None
-
         # Execute GUI callback - notify game disconnection
         if gui_instance is not None:
             try:
@@ -975,22 +1251,19 @@ def play_single_player(
         record_file: Optional custom file name for recording
     """
 
+    # Sync the ini file in the background while the game is configured
     print("[INFO] INI 파일 동기화 중...")
-    sync_vizdoom_ini()
+    ini_sync = threading.Thread(target=sync_vizdoom_ini, daemon=True)
+    ini_sync.start()
 
     # Initialize the game
     game = vzd.DoomGame()
     game_initialized = False
     esp_enabled = False  # Track ESP activation
     esp_window = None  # Tkinter window instance
-
-    # Additional protection for autorelease pool on macOS
-    if is_macos:
-        try:
-            # Call gc at the point of direct resource use
-            gc.collect()
-        except:
-            pass
+    esp_worker = None  # Background overlay drawing thread
+    gc_frozen = False  # Set once the collector is frozen after init
+    gc_disabled = False  # Whether this call disabled the collector
 
     # 싱글플레이어 모드에서는 항상 레코딩
     # 녹화 파일 저장 디렉토리 생성
@@ -1014,8 +1287,14 @@ def play_single_player(
 
     # Explicitly specify OpenCV backend (QT may be more stable on macOS)
     try:
-        # Most stable backend on macOS
-        cv2.setNumThreads(1)  # Limit multithreading for improved stability
+        # Make sure OpenCV's SIMD code paths are enabled
+        cv2.setUseOptimized(True)
+        # Let OpenCV parallelize resize/color loops; keep the single-thread
+        # setting only on macOS where it was added for Tk/Obj-C stability
+        if not is_macos:
+            cv2.setNumThreads(0)  # 0 = OpenCV picks the thread count
+        else:
+            cv2.setNumThreads(1)
         # Remove previous Qt environment variable setting
         if "QT_QPA_PLATFORM" in os.environ:
             del os.environ["QT_QPA_PLATFORM"]
@@ -1029,7 +1308,9 @@ def play_single_player(
 
         # Set larger screen resolution for better gameplay experience
         game.set_screen_resolution(vzd.ScreenResolution.RES_640X480)
-        game.set_screen_format(vzd.ScreenFormat.RGB24)  # Use RGB24 for better colors
+        # RGB24 frames are (height, width, channels) in the order the ESP
+        # window displays
+        game.set_screen_format(vzd.ScreenFormat.RGB24)
 
         # Set rendering options for better visuals
         game.set_render_hud(True)
@@ -1046,16 +1327,17 @@ def play_single_player(
         # Set map to map01
         game.set_doom_map("map01")
 
-        # Additional settings to make the game playable
-        game.add_game_args(f"-skill 3 +name {name} +colorset {color}")
-        game.add_game_args(f"+timelimit {episode_timeout}")
-
-        # 레코딩 설정 - 항상 활성화
-        game.add_game_args(f"-record {recording_path}")
-        game.add_game_args("+cl_capfps 0")  # 프레임 레이트 제한 해제
-
-        # Widescreen support
-        game.add_game_args("+vid_aspect 16:9")
+        # Engine arguments, passed in a single call
+        game_args = [
+            # Additional settings to make the game playable
+            f"-skill 3 +name {name} +colorset {color}",
+            f"+timelimit {episode_timeout}",
+            # 레코딩 설정 - 항상 활성화
+            f"-record {recording_path}",
+            "+cl_capfps 0",  # 프레임 레이트 제한 해제
+            "+vid_aspect 16:9",  # Widescreen support
+        ]
+        game.add_game_args(" ".join(game_args))
 
         # Set up controls and variables
         setup_input_controls(game)
@@ -1063,10 +1345,17 @@ def play_single_player(
 
         # Initialize the game
         print("Starting single player game...")
+        ini_sync.join()  # game.init() reads _vizdoom.ini
         game.init()
         game_initialized = True
         print(f"Game started as {name}")
 
+        # The single freeze point: move import-time objects and the
+        # long-lived game objects created by init out of the collector's
+        # generations so later collections do not rescan them
+        gc.freeze()
+        gc_frozen = True
+
         # 레코딩 상태 표시
         print(f"[INFO] 게임 레코딩이 시작되었습니다.")
 
@@ -1085,8 +1374,13 @@ def play_single_player(
                     title=f"ViZDoom ESP Overlay - {name}",
                     width=screen_width,
                     height=screen_height,
+                    drive_events=gui_instance is None,
                 )
                 esp_enabled = True
+                # Draw the overlay off the game thread
+                esp_worker = ESPRenderWorker(
+                    esp_window, (screen_height, screen_width, 3)
+                )
                 # Store ESP window reference in GUI instance
                 if gui_instance is not None:
                     gui_instance.esp_window = esp_window
@@ -1105,94 +1399,88 @@ def play_single_player(
         try:
             print("Starting game loop...")
 
-            while not game.is_episode_finished():
+            # Whether states carry an objects attribute; probed once on the
+            # first state since the schema is fixed for the whole game
+            has_objects_attr = None
+
+            # Bound methods used every tic, looked up once
+            is_episode_finished = game.is_episode_finished
+            is_player_dead = game.is_player_dead
+            advance_action = game.advance_action
+            get_state = game.get_state
+
+            # Player position and view angles are read from the state's
+            # game_variables array in one indexing operation
+            esp_var_idx = (
+                esp_variable_indices(game) if esp_worker is not None else None
+            )
+
+            # Cleared once the ESP window closes or the worker stops, so later
+            # tics skip ESP with a single local check
+            esp_active = esp_worker is not None
+
+            # The loop allocates nothing long-lived, so skip cyclic collections
+            # until the game ends; refcounting still frees per-frame objects.
+            # gc.disable() is process-wide, so only do this in command line mode:
+            # with the GUI this loop runs on a background thread while the Tk
+            # main thread keeps running
+            if gui_instance is None and gc.isenabled():
+                gc.disable()
+                gc_disabled = True
+
+            while not is_episode_finished():
                 # Respawn if dead
-                if game.is_player_dead():
+                if is_player_dead():
                     game.respawn_player()
 
                 # Update game state
-                game.advance_action()
-                state = game.get_state()
+                advance_action()
+                state = get_state()
 
                 if state is None:
                     continue
 
+                if has_objects_attr is None:
+                    has_objects_attr = hasattr(state, "objects")
+
                 # ESP overlay functionality
-                if esp_enabled and esp_window is not None and esp_window.is_open:
+                if esp_active:
+                    if not esp_window.is_open or not esp_worker.is_running:
+                        # Window closed or the worker gave up - stop ESP for this game
+                        # and close the window so it is not left mapped but unpumped
+                        esp_active = False
+                        esp_enabled = False
+                        _teardown_esp(esp_window, esp_worker, gui_instance)
+                        continue
+                    if not esp_window.is_visible:
+                        # Window minimized or hidden - skip all ESP work
+                        esp_window.process_events()
+                        continue
                     try:
-                        print("[INFO] ESP overlay is activated.")
-                        px = game.get_game_variable(vzd.GameVariable.POSITION_X)
-                        py = game.get_game_variable(vzd.GameVariable.POSITION_Y)
-                        pz = game.get_game_variable(vzd.GameVariable.POSITION_Z)
-                        angle_deg = game.get_game_variable(vzd.GameVariable.ANGLE)
-                        pitch_deg = game.get_game_variable(vzd.GameVariable.PITCH)
+                        px, py, pz, angle_deg, pitch_deg = state.game_variables[
+                            esp_var_idx
+                        ].tolist()
 
                         if state.screen_buffer is None:
-                            print("[WARN] Screen buffer is None.")
+                            if state.number % 300 == 0:
+                                logger.warning("Screen buffer is None.")
                             continue
 
-                        screen_buf = state.screen_buffer
-
-                        # Handle different buffer formats
-                        if (
-                            len(screen_buf.shape) == 3
-                        ):  # Possible (channels, height, width) format
-                            # Check each dimension size
-                            if screen_buf.shape[0] == 3:  # (channels, height, width)
-                                screen_buf = np.transpose(screen_buf, (1, 2, 0))
-                            elif (
-                                screen_buf.shape[2] == 3
-                            ):  # Already (height, width, channels) format
-                                pass  # No conversion needed
-                            else:  # (width, height, channels) or other format
-                                screen_buf = np.transpose(screen_buf, (1, 0, 2))
-
-                        frame = cv2.cvtColor(screen_buf, cv2.COLOR_RGB2BGR)
-
-                        # Get object information
-                        player_objects = []
-                        has_object_info = (
-                            hasattr(state, "objects") and state.objects is not None
+                        # Screen format is RGB24, so no transpose or color
+                        # conversion is needed. Each state owns a fresh buffer,
+                        # so the worker draws the overlay on it in place.
+                        objects = state.objects if has_objects_attr else None
+                        esp_worker.submit(
+                            state.screen_buffer,
+                            (px, py, pz),
+                            angle_deg,
+                            pitch_deg,
+                            objects,
+                            state.number,
                         )
-
-                        if has_object_info:
-                            # Get objects info
-                            player_objects = get_all_objects_info(
-                                state.objects, px, py, 0
-                            )
-
-                            # Apply ESP overlay
-                            try:
-                                frame_with_esp = draw_esp_overlay(
-                                    frame.copy(),
-                                    (px, py, pz),
-                                    angle_deg,
-                                    pitch_deg,
-                                    player_objects,
-                                )
-
-                                # Display ESP frame in Tkinter window
-                                if not esp_window.update_frame(frame_with_esp):
-                                    # Update failed - deactivate ESP
-                                    esp_enabled = False
-
-                            except Exception as e:
-                                print(
-                                    f"[ERROR] ESP overlay application error: {str(e)}"
-                                )
-                                # Display base frame on error
-                                try:
-                                    esp_window.update_frame(frame)
-                                except:
-                                    pass
-                        else:
-                            # No object information - display original screen
-                            try:
-                                esp_window.update_frame(frame)
-                            except:
-                                pass
+                        esp_window.process_events()
                     except Exception as e:
-                        print(f"[ERROR] Error during ESP processing: {str(e)}")
+                        logger.error("Error during ESP processing: %s", e)
 
             print("Episode finished!")
             print(f"Player frags: {game.get_game_variable(vzd.GameVariable.FRAGCOUNT)}")
@@ -1226,38 +1514,10 @@ def play_single_player(
         # Game cleanup
         print("Game finished!")
 
-        # Additional cleanup on macOS
-        if is_macos:
-            try:
-                # Call gc at the point of direct resource release
-                gc.collect()
-            except:
-                pass
-
         # Close ESP window first
-        if esp_enabled and esp_window is not None:
-            try:
-                # Close in GUI thread for resource cleanup
-                if (
-                    gui_instance is not None
-                    and hasattr(gui_instance, "root")
-                    and gui_instance.root.winfo_exists()
-                ):
-                    # Remove GUI reference
-                    if hasattr(gui_instance, "esp_window"):
-                        gui_instance.esp_window = None
-
-                    # Execute window closing in GUI thread
-                    gui_instance.root.after(0, esp_window.on_closing)
-                    time.sleep(0.2)  # Allow time for window to close
-                else:
-                    # Close window directly
-                    esp_window.on_closing()
-
-                # Remove reference
-                esp_window = None
-            except Exception as e:
-                print(f"[WARN] Failed to close ESP window: {str(e)}")
+        if esp_enabled:
+            _teardown_esp(esp_window, esp_worker, gui_instance)
+        esp_window = esp_worker = None
 
         # Game cleanup next
         try:
@@ -1268,13 +1528,14 @@ def play_single_player(
 
         print("Game closed")
 
-        # Memory cleanup
+        # Memory cleanup; re-enable the collector if the game loop disabled
+        # it and unfreeze first so the game objects frozen after init can be
+        # reclaimed
+        if gc_disabled:
+            gc.enable()
+        if gc_frozen:
+            gc.unfreeze()
         gc.collect()
-        time.sleep(0.1)
-        gc.collect()
-
-        # Explicitly set to None to decrease reference count
-        esp_window = None
 
         # Execute GUI callback - notify game disconnection
         if gui_instance is not None:
@@ -1341,9 +1602,18 @@ if __name__ == "__main__":
     parser.add_argument(
         "--singleplayer", action="store_true", help="Start single player game directly"
     )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Print per-frame debug information"
+    )
 
     args = parser.parse_args()
 
+    # Hot-loop diagnostics go through logging; only warnings and errors by default
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="[%(levelname)s] %(message)s",
+    )
+
     # Connect directly with command line arguments
     if args.host and args.port:
         player_client(
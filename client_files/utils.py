@@ -1,5 +1,6 @@
 import os
 import math
+import functools
 import cv2
 import numpy as np
 import vizdoom as vzd
@@ -9,12 +10,8 @@ import shutil
 
 
 def normalize_angle_deg(deg):
-    """-180~180 범위로 정규화"""
-    while deg > 180:
-        deg -= 360
-    while deg <= -180:
-        deg += 360
-    return deg
+    """-180~180 범위로 정규화 (-180 < deg <= 180)"""
+    return 180.0 - (180.0 - deg) % 360.0
 
 
 def sync_vizdoom_ini(script_dir=None):
@@ -68,19 +65,181 @@ def calculate_relative_angle(player_x, player_y, player_angle, target_x, target_
 
 def calculate_distance(x1, y1, x2, y2):
     """두 점 사이의 거리 계산"""
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    return math.hypot(x2 - x1, y2 - y1)
 
 
-def get_all_objects_info(objects, player_x=0, player_y=0, debug_detail=False):
-    """모든 오브젝트 정보를 추출하는 함수"""
+# ViZDoom 오브젝트 한 개를 담는 구조체 레코드 (SoA 접근용)
+OBJECT_DTYPE = np.dtype([
+    ("id", np.int32),
+    ("x", np.float32),
+    ("y", np.float32),
+    ("z", np.float32),
+    ("angle", np.float32),
+    ("pitch", np.float32),
+    ("type", np.int32),
+])
+
+# get_all_objects_info 에서 재사용하는 오브젝트 레코드 작업 버퍼
+_OBJECTS_SCRATCH = np.empty(256, dtype=OBJECT_DTYPE)
+
+
+def objects_to_records(objects, out=None):
+    """ViZDoom 오브젝트 목록을 OBJECT_DTYPE 구조체 배열로 한 번에 변환
+
+    Args:
+        objects: ViZDoom 오브젝트 목록
+        out: 채울 OBJECT_DTYPE 작업 버퍼 (None이면 모듈 버퍼 사용,
+            오브젝트 수보다 작으면 새로 할당)
+
+    Returns:
+        (N,) 형태의 OBJECT_DTYPE 배열 (작업 버퍼의 뷰)
+    """
+    global _OBJECTS_SCRATCH
+    count = len(objects)
+    if out is None:
+        if len(_OBJECTS_SCRATCH) < count:
+            _OBJECTS_SCRATCH = np.empty(count, dtype=OBJECT_DTYPE)
+        out = _OBJECTS_SCRATCH
+    elif len(out) < count:
+        out = np.empty(count, dtype=OBJECT_DTYPE)
+    records = out[:count]
+
+    if count > 0:
+        # type 속성 유무는 목록 전체에서 동일하므로 첫 오브젝트로 한 번만 확인
+        if hasattr(objects[0], "type"):
+            records[:] = [
+                (o.id, o.position_x, o.position_y, o.position_z, o.angle, o.pitch, o.type)
+                for o in objects
+            ]
+        else:
+            records[:] = [
+                (o.id, o.position_x, o.position_y, o.position_z, o.angle, o.pitch, 0)
+                for o in objects
+            ]
+    return records
+
+
+def _valid_objects_to_records(objects):
+    """objects_to_records 의 느린 대체 경로: 오브젝트마다 변환하고 실패한 것은 제외
+
+    Returns:
+        (변환에 성공한 오브젝트 목록, 그 순서의 OBJECT_DTYPE 배열)
+    """
+    valid = []
+    rows = []
+    for o in objects:
+        try:
+            row = (
+                o.id, o.position_x, o.position_y, o.position_z,
+                o.angle, o.pitch, getattr(o, "type", 0),
+            )
+            # 값이 구조체 필드로 변환되는지도 확인
+            np.array([row], dtype=OBJECT_DTYPE)
+        except Exception as e:
+            print(f"[ERROR] 오브젝트 정보 추출 중 오류: {e}")
+            continue
+        valid.append(o)
+        rows.append(row)
+    return valid, np.array(rows, dtype=OBJECT_DTYPE)
+
+
+def compute_distances(records, player_x, player_y):
+    """플레이어와 각 오브젝트 사이의 2D 거리를 한 번에 계산
+
+    Args:
+        records: objects_to_records 가 만든 OBJECT_DTYPE 배열
+        player_x: 플레이어 x 좌표
+        player_y: 플레이어 y 좌표
+
+    Returns:
+        (N,) 형태의 거리 배열
+    """
+    return np.hypot(records["x"] - player_x, records["y"] - player_y)
+
+
+# 적 오브젝트 이름 목록 (오브젝트 이름에 포함되면 적으로 분류)
+_ENEMY_NAMES = (
+    "ZombieMan",
+    "ShotgunGuy",
+    "ChaingunGuy",
+    "DoomImp",
+    "Demon",
+    "Spectre",
+    "LostSoul",
+    "Cacodemon",
+    "HellKnight",
+    "BaronOfHell",
+    "Arachnotron",
+    "PainElemental",
+    "Revenant",
+    "Mancubus",
+    "Archvile",
+    "SpiderMastermind",
+    "Cyberdemon",
+    "DoomPlayer",  # 다른 플레이어도 포함
+)
+
+# 오브젝트 이름별 적 분류 결과 캐시
+_ENEMY_NAME_CACHE = {}
+
+# 오브젝트 타입별 선택 속성 보유 여부 캐시
+# (name, health, is_visible, visible, alpha, player_number)
+_OBJECT_ATTR_CACHE = {}
+
+
+def _object_attr_flags(obj):
+    """오브젝트 타입의 선택 속성 보유 여부를 타입별로 한 번만 확인"""
+    obj_type = type(obj)
+    flags = _OBJECT_ATTR_CACHE.get(obj_type)
+    if flags is None:
+        flags = tuple(
+            hasattr(obj, attr)
+            for attr in ("name", "health", "is_visible", "visible", "alpha", "player_number")
+        )
+        _OBJECT_ATTR_CACHE[obj_type] = flags
+    return flags
+
+
+# 첫 번째 오브젝트의 속성 덤프를 이미 출력했는지 여부
+_OBJECT_ATTRS_DUMPED = False
+
+
+def is_enemy_name(name):
+    """오브젝트 이름이 적 이름을 포함하는지 확인
+
+    StealthZombieMan 같은 파생 클래스 이름도 적으로 분류되도록 부분 문자열로
+    비교하고, 맵에 등장하는 이름 종류는 적으므로 결과를 이름별로 캐시한다.
+    """
+    try:
+        return _ENEMY_NAME_CACHE[name]
+    except KeyError:
+        result = any(enemy in name for enemy in _ENEMY_NAMES)
+        _ENEMY_NAME_CACHE[name] = result
+        return result
+
+
+def get_all_objects_info(objects, player_x=0, player_y=0, debug_detail=False, out=None):
+    """모든 오브젝트 정보를 추출하는 함수
+
+    Args:
+        objects: ViZDoom 오브젝트 목록
+        player_x: 플레이어 x 좌표
+        player_y: 플레이어 y 좌표
+        debug_detail: 디버깅 정보 출력 여부
+        out: 오브젝트 레코드를 채울 OBJECT_DTYPE 작업 버퍼
+            (objects_to_records 참고)
+    """
+    global _OBJECT_ATTRS_DUMPED
     objects_info = []
     enemy_objects = []
+    enemy_distances = []  # enemy_objects 와 같은 순서의 거리 목록
     
     if objects is None:
         return objects_info
     
-    # 첫 번째 오브젝트의 속성 출력 (디버깅용)
-    if len(objects) > 0 and debug_detail:
+    # 첫 번째 오브젝트의 속성 출력 (디버깅용, 속성 목록은 바뀌지 않으므로 한 번만)
+    if len(objects) > 0 and debug_detail and not _OBJECT_ATTRS_DUMPED:
+        _OBJECT_ATTRS_DUMPED = True
         print(f"[DEBUG] 오브젝트 속성 목록: {dir(objects[0])}")
         # 첫 번째 오브젝트의 모든 속성값 출력
         print("\n[DEBUG] 첫 번째 오브젝트 모든 속성값:")
@@ -92,43 +251,52 @@ def get_all_objects_info(objects, player_x=0, player_y=0, debug_detail=False):
                 except Exception as e:
                     print(f"   - {attr}: [에러: {e}]")
     
-    # 적 오브젝트 이름 목록
-    enemy_names = [
-        "ZombieMan", 
-        "ShotgunGuy",
-        "ChaingunGuy", 
-        "DoomImp",
-        "Demon",
-        "Spectre",
-        "LostSoul",
-        "Cacodemon",
-        "HellKnight",
-        "BaronOfHell",
-        "Arachnotron",
-        "PainElemental",
-        "Revenant",
-        "Mancubus",
-        "Archvile",
-        "SpiderMastermind",
-        "Cyberdemon",
-        "DoomPlayer"  # 다른 플레이어도 포함
-    ]
-    
+    # 오브젝트 필드를 구조체 배열로 한 번에 추출하고 거리를 벡터 연산으로 계산
+    try:
+        records = objects_to_records(objects, out)
+    except Exception as e:
+        # 필드를 읽을 수 없는 오브젝트가 섞여 있으면 그 오브젝트만 건너뜀
+        print(f"[ERROR] 오브젝트 정보 추출 중 오류: {e}")
+        objects, records = _valid_objects_to_records(objects)
+    distances = compute_distances(records, player_x, player_y).tolist()
+    ids = records["id"].tolist()
+    positions = records[["x", "y", "z"]].tolist()
+    pitches = records["pitch"].tolist()
+    angles = records["angle"].tolist()
+    types = records["type"].tolist()
+
     # 모든 오브젝트 정보 추출
-    for obj in objects:
+    for i, obj in enumerate(objects):
         try:
             # 아이템 제외
-            if hasattr(obj, "type") and obj.type == 1:  # type 1은 아이템
+            if types[i] == 1:  # type 1은 아이템
                 continue
-                
+
+            # 선택 속성 보유 여부 (타입별 캐시)
+            (
+                has_name,
+                has_health,
+                has_is_visible,
+                has_visible,
+                has_alpha,
+                has_player_number,
+            ) = _object_attr_flags(obj)
+
+            # 적이 아닌 오브젝트는 반환 목록에 들어가지 않으므로, 디버그 집계가
+            # 필요 없으면 정보 dict 를 만들지 않고 건너뜀 (서버 호스트 포함)
+            is_enemy = has_name and is_enemy_name(obj.name)
+            if not is_enemy and not debug_detail:
+                continue
+
             # 기본 정보 추출
+            obj_id = ids[i]
             obj_info = {
-                "id": obj.id,
-                "position": (obj.position_x, obj.position_y, obj.position_z),
-                "pitch": obj.pitch,
-                "angle": obj.angle,
-                "name": getattr(obj, "name", f"Object_{obj.id}"),
-                "type": getattr(obj, "type", 0)
+                "id": obj_id,
+                "position": positions[i],
+                "pitch": pitches[i],
+                "angle": angles[i],
+                "name": obj.name if has_name else f"Object_{obj_id}",
+                "type": types[i]
             }
             
             # 특정 ID를 가진 플레이어는 항상 죽은 상태로 처리
@@ -155,11 +323,11 @@ def get_all_objects_info(objects, player_x=0, player_y=0, debug_detail=False):
                 is_invisible = False
                 
                 # 다양한 투명 감지 방법 시도
-                if hasattr(obj, "is_visible") and not obj.is_visible:
+                if has_is_visible and not obj.is_visible:
                     is_invisible = True
-                elif hasattr(obj, "visible") and not obj.visible:
+                elif has_visible and not obj.visible:
                     is_invisible = True
-                elif hasattr(obj, "alpha") and obj.alpha < 0.5:  # 투명도가 낮은 경우
+                elif has_alpha and obj.alpha < 0.5:  # 투명도가 낮은 경우
                     is_invisible = True
                 
                 # 위치가 (0,0,0)에 가까운 플레이어는 보통 서버 플레이어
@@ -175,7 +343,7 @@ def get_all_objects_info(objects, player_x=0, player_y=0, debug_detail=False):
                         print(f"[INFO] 투명한 플레이어 감지됨: ID={obj_info['id']}")
                 
                 # 플레이어 번호 추출 시도
-                if hasattr(obj, "player_number"):
+                if has_player_number:
                     obj_info["player_number"] = obj.player_number
                     obj_info["name"] = f"Player{obj.player_number}"
                     if debug_detail:
@@ -184,26 +352,24 @@ def get_all_objects_info(objects, player_x=0, player_y=0, debug_detail=False):
                     obj_info["name"] = f"Player_{obj.id}"
             
             # 추가 속성 확인 및 추출
-            if hasattr(obj, "health"):
+            if has_health:
                 obj_info["health"] = obj.health
                 # 플레이어 상태도 추출 (살아있는지 여부)
                 obj_info["is_dead"] = obj.health <= 0
             
-            # 거리 계산
-            dx = obj.position_x - player_x
-            dy = obj.position_y - player_y
-            distance = math.sqrt(dx*dx + dy*dy)
-            obj_info["distance"] = distance
+            # 거리 (미리 계산된 값 사용)
+            obj_info["distance"] = distances[i]
             
             # 적 오브젝트 분류 (살아있는 적만 포함)
-            if hasattr(obj, "name") and any(enemy in obj.name for enemy in enemy_names):
+            if is_enemy:
                 # 살아있는 적 또는 플레이어만 ESP에 표시
-                if not hasattr(obj, "health") or obj.health > 0:
+                if not has_health or obj.health > 0:
                     enemy_objects.append(obj_info)
                 else:
                     # 죽은 적은 리스트에 추가하지 않거나, 상태 표시를 위해 추가
                     obj_info["is_dead"] = True
                     enemy_objects.append(obj_info)
+                enemy_distances.append(distances[i])
             
             objects_info.append(obj_info)
         except Exception as e:
@@ -214,13 +380,18 @@ def get_all_objects_info(objects, player_x=0, player_y=0, debug_detail=False):
         print(f"\n[DEBUG] 감지된 총 오브젝트 수: {len(objects_info)}")
         print(f"[DEBUG] 감지된 적 오브젝트 수: {len(enemy_objects)}")
     
-    # 적 오브젝트 정보 출력 (거리순 정렬)
-    enemy_objects.sort(key=lambda x: x["distance"])
-    
-    return enemy_objects
+    # 적 오브젝트 정보 출력 (거리순 정렬, 거리 배열의 안정 정렬 순서로 재배치)
+    order = np.argsort(enemy_distances, kind="stable")
+    return [enemy_objects[i] for i in order.tolist()]
 
 
 
+@functools.lru_cache(maxsize=16)
+def _fov_scale(screen_width, fov_deg):
+    """가로 FOV 에 따른 화면 투영 배율 (해상도와 FOV 별로 한 번만 계산)"""
+    return (screen_width / 2) / math.tan(math.radians(fov_deg / 2.0))
+
+
 def world_to_screen(player_x, player_y, player_z,
                     player_angle_deg, player_pitch_deg,
                     obj_x, obj_y, obj_z,
@@ -254,8 +425,7 @@ def world_to_screen(player_x, player_y, player_z,
         return None
     
     # 3) 가로 FOV에 따른 화면 X좌표
-    half_fov = math.radians(fov_deg / 2.0)
-    scale = (screen_width / 2) / math.tan(half_fov)
+    scale = _fov_scale(screen_width, fov_deg)
     screen_x = (screen_width / 2) + (localY * scale / localX)
 
     # 4) 세로 좌표는 z차이를 간단히 반영
@@ -267,7 +437,7 @@ def world_to_screen(player_x, player_y, player_z,
     
 
     # screen_y = (screen_height / 2) - (dz * scale / localX * 3.0)
-    screen_y = (screen_height / 2)*0.9 - (math.radians(player_pitch_deg)+math.atan(dz/math.sqrt(dx**2+dy**2))) * scale 
+    screen_y = (screen_height / 2)*0.9 - (math.radians(player_pitch_deg)+math.atan(dz/math.hypot(dx, dy))) * scale 
 
     # 5) 화면 범위 밖이면 None 처리(선택)
     if not (0 <= screen_x <= screen_width and 0 <= screen_y <= screen_height):
@@ -277,93 +447,195 @@ def world_to_screen(player_x, player_y, player_z,
     return int(screen_x), int(screen_y)
 
 
+def world_to_screen_batch(player_x, player_y, player_z,
+                          player_angle_deg, player_pitch_deg,
+                          obj_positions,
+                          screen_width, screen_height,
+                          fov_deg=90.0):
+    """
+    world_to_screen 의 벡터화 버전. 여러 오브젝트를 한 번에 투영한다.
+
+    Args:
+        obj_positions: (N, 3) 형태의 오브젝트 (x, y, z) 좌표 배열
+
+    Returns:
+        (visible_idx, screen_xy): 카메라 앞쪽 오브젝트의 인덱스 배열과 (M, 2) int 화면 좌표
+    """
+    dx = obj_positions[:, 0] - player_x
+    dy = obj_positions[:, 1] - player_y
+    dz = obj_positions[:, 2] - player_z
+
+    yaw = math.radians(player_angle_deg)
+    cos_yaw = math.cos(yaw)
+    sin_yaw = math.sin(yaw)
+
+    local_x = dx * cos_yaw + dy * sin_yaw
+    local_y = -(-dx * sin_yaw + dy * cos_yaw)
+
+    # 뒤쪽(localX <= 0)은 화면 표시 안 함
+    visible_idx = np.flatnonzero(local_x > 0)
+    dx = dx[visible_idx]
+    dy = dy[visible_idx]
+    dz = dz[visible_idx]
+
+    scale = _fov_scale(screen_width, fov_deg)
+
+    screen_xy = np.empty((len(visible_idx), 2), dtype=np.float64)
+    screen_xy[:, 0] = (screen_width / 2) + (local_y[visible_idx] * scale / local_x[visible_idx])
+    screen_xy[:, 1] = (screen_height / 2) * 0.9 - (
+        math.radians(player_pitch_deg) + np.arctan2(dz, np.hypot(dx, dy))
+    ) * scale
+
+    return visible_idx, screen_xy.astype(np.int64)
+
+
+# draw_esp_overlay 에서 재사용하는 오버레이 작업 버퍼 (프레임 크기가 바뀌면 새로 할당)
+_OVERLAY_SCRATCH = None
+
+
+def reserve_overlay_buffer(frame_shape):
+    """게임 시작 시 화면 해상도에 맞춰 오버레이 작업 버퍼를 미리 할당
+
+    Args:
+        frame_shape: (height, width, channels) 형태의 프레임 크기
+    """
+    global _OVERLAY_SCRATCH
+    if _OVERLAY_SCRATCH is None or _OVERLAY_SCRATCH.shape != tuple(frame_shape):
+        _OVERLAY_SCRATCH = np.empty(frame_shape, dtype=np.uint8)
+
+
+@functools.lru_cache(maxsize=256)
+def _label_size(text):
+    """ESP 라벨 텍스트의 ((너비, 높이), 베이스라인) 크기 (문자열별 캐시)"""
+    return cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+
+
 def draw_esp_overlay(frame, player_pos, player_angle, player_pitch, objects_info):
-    """게임 화면에 ESP 정보 오버레이"""
+    """게임 화면에 ESP 정보 오버레이
+
+    표시할 도형이 차지하는 영역(ROI)만 작업 버퍼에 복사하고 블렌딩하며,
+    표시할 오브젝트가 없으면 프레임을 그대로 반환한다.
+    """
+    global _OVERLAY_SCRATCH
     height, width = frame.shape[:2]
-    overlay = frame.copy()
 
     # 플레이어 위치 정보
     px, py, pz = player_pos  # player_pos를 (x, y, z) 형태로 받음
 
-    # 각 오브젝트 정보 처리
-    for i, obj in enumerate(objects_info):
-        # 죽은 플레이어는 표시하지 않음
-        is_dead = obj.get("is_dead", False) or (obj.get("health", 100) <= 0)
-        if is_dead:
-            continue  # 죽은 객체는 건너뛰기
-        
-        obj_x, obj_y, obj_z = obj["position"]
-        obj_name = obj["name"]
-        obj_id = obj["id"]
-        obj_angle = obj["angle"]
+    # 죽은 플레이어는 표시하지 않음
+    alive_objects = [
+        obj for obj in objects_info
+        if not (obj.get("is_dead", False) or obj.get("health", 100) <= 0)
+    ]
+    if not alive_objects:
+        return frame
+
+    # 색상 설정 - 기본은 빨간색 (프레임이 RGB24 이므로 RGB: 255, 0, 0)
+    color = (255, 0, 0)
+    font = cv2.FONT_HERSHEY_SIMPLEX
+
+    # 모든 오브젝트를 한 번에 투영 (z차이 사용)
+    positions = np.array([obj["position"] for obj in alive_objects], dtype=np.float64)
+    visible_idx, screen_xy = world_to_screen_batch(
+        px, py, pz,
+        player_angle,
+        player_pitch,
+        positions,
+        width, height,
+        fov_deg=90.0
+    )
+
+    # 그릴 항목과 그 항목들이 차지하는 영역의 합집합을 먼저 계산
+    draws = []
+    x0, y0, x1, y1 = width, height, 0, 0
+    for i, (sx, sy) in zip(visible_idx.tolist(), screen_xy.tolist()):
+        obj = alive_objects[i]
         distance = obj["distance"]
 
-        # 색상 설정 - 기본은 빨간색 (BGR: 0, 0, 255)
-        color = (0, 0, 255)
-
-        # 간단한 3D 투영 (z차이 사용)
-        screen_pos = world_to_screen(
-            px, py, pz,               # 플레이어 위치 x,y,z
-            player_angle,             # 플레이어 각도
-            player_pitch,             # 플레이어 피치
-            obj_x, obj_y, obj_z,      # 오브젝트 x,y,z
-            width, height,
-            fov_deg=90.0
+        # 거리에 따라 표시 크기 조정
+        size = max(3, int(80 / (1 + distance / 200)))
+
+        # 거리 및 상태 텍스트, 오브젝트 이름
+        status_text = f" HP:{obj['health']}" if "health" in obj else ""
+        top_text = f"{distance:.0f}" + status_text
+        name_text = f"{obj['name']}"
+        (top_w, top_h), _ = _label_size(top_text)
+        (name_w, _), name_base = _label_size(name_text)
+
+        # 원(두께 2)과 두 텍스트를 감싸는 영역 (여백 2px)
+        x0 = min(x0, sx - size - 3, sx - 22)
+        x1 = max(x1, sx + size + 3, sx - 18 + max(top_w, name_w))
+        y0 = min(y0, sy - size - 7 - top_h)
+        y1 = max(y1, sy + size + 17 + name_base)
+
+        draws.append((sx, sy, size, top_text, name_text))
+
+    x0, y0 = max(x0, 0), max(y0, 0)
+    x1, y1 = min(x1, width), min(y1, height)
+    if not draws or x0 >= x1 or y0 >= y1:
+        return frame
+
+    # 프레임마다 새로 할당하지 않는 작업 버퍼에 ROI 만 복사
+    if _OVERLAY_SCRATCH is None or _OVERLAY_SCRATCH.shape != frame.shape:
+        _OVERLAY_SCRATCH = np.empty_like(frame)
+    overlay = _OVERLAY_SCRATCH
+    frame_roi = frame[y0:y1, x0:x1]
+    overlay_roi = overlay[y0:y1, x0:x1]
+    np.copyto(overlay_roi, frame_roi)
+
+    for sx, sy, size, top_text, name_text in draws:
+        # 원 그리기
+        cv2.circle(overlay, (sx, sy), size, color, 2)
+
+        # 거리 및 상태 표시
+        cv2.putText(
+            overlay,
+            top_text,
+            (sx - 20, sy - size - 5),
+            font,
+            0.5,
+            color,
+            1,
         )
-        
-        if screen_pos is not None:
-            sx, sy = screen_pos
-            # 거리에 따라 표시 크기 조정 (죽은 경우 더 작게 표시)
-            size = max(3, int(80 / (1 + distance / 200)))
-            if is_dead:
-                size = max(2, size // 2)  # 죽은 경우 크기 감소
-            
-            # 원 그리기
-            cv2.circle(overlay, (sx, sy), size, color, 2)
-            
-            # 상태 텍스트 설정
-            status_text = ""
-            if is_dead:
-                status_text = " DEAD"
-            elif "health" in obj:
-                status_text = f" HP:{obj['health']}"
-                
-            # 거리 및 상태 표시
-            cv2.putText(
-                overlay,
-                f"{distance:.0f}" + status_text,
-                (sx - 20, sy - size - 5),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.5,
-                color,
-                1,
-            )
-            
-            # 오브젝트 이름 표시
-            cv2.putText(
-                overlay,
-                f"{obj_name}",
-                (sx - 20, sy + size + 15),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.5,
-                color,
-                1,
-            )
 
-    # 오버레이 적용 (70% 투명도)
+        # 오브젝트 이름 표시
+        cv2.putText(
+            overlay,
+            name_text,
+            (sx - 20, sy + size + 15),
+            font,
+            0.5,
+            color,
+            1,
+        )
+
+    # 오버레이 적용 (70% 투명도) - 그려진 영역만 블렌딩
     alpha = 0.7
-    cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
+    cv2.addWeighted(overlay_roi, alpha, frame_roi, 1 - alpha, 0, frame_roi)
 
     return frame
 
 
+def stack_hwc_as_chw(frames):
+    """[H, W, C] 프레임들을 연속된 [T, C, H, W] 배열 하나로 쌓음
+
+    Args:
+        frames: 같은 크기의 [H, W, C] 프레임 목록
+
+    Returns:
+        미리 할당한 배열에 프레임마다 바로 전치해 넣은 [T, C, H, W] 배열
+    """
+    height, width, channels = frames[0].shape
+    out = np.empty((len(frames), channels, height, width), dtype=frames[0].dtype)
+    for t, frame in enumerate(frames):
+        out[t] = frame.transpose(2, 0, 1)
+    return out
+
+
 def save_episode(obs_list, map_list, measurements_list, location_list, action_list, done_list, num_episodes, writer):
     # Convert lists to numpy arrays and transpose as needed.
-    obs_array = np.stack(obs_list)  # [T, H, W, C]
-    obs_array = np.transpose(obs_array, (0, 3, 1, 2))  # [T, C, H, W]
-
-    map_array = np.stack(map_list)
-    map_array = np.transpose(map_array, (0, 3, 1, 2))
+    obs_array = stack_hwc_as_chw(obs_list)  # [T, C, H, W]
+    map_array = stack_hwc_as_chw(map_list)
 
     measurements_array = np.stack(measurements_list)
     location_array = np.stack(location_list)
@@ -411,13 +683,21 @@ def rotate_and_resize(image, angle, output_size=(360, 360), center_coord=None):
     # 회전 행렬 계산 (이미지 좌표계에서는 각도를 음수로 변환해야 함)
     rotation_matrix = cv2.getRotationMatrix2D(center, -angle, 1.0)
     
-    # 회전된 이미지 계산
-    rotated = cv2.warpAffine(image, rotation_matrix, (w, h), 
+    # 출력 크기로의 스케일을 회전 행렬에 합쳐 한 번의 보간으로 처리
+    # (S @ [M; 0 0 1] 은 M 의 각 행에 배율을 곱한 것과 같음)
+    scale_x = output_size[0] / w
+    scale_y = output_size[1] / h
+    rotation_matrix[0] *= scale_x
+    rotation_matrix[1] *= scale_y
+    # cv2.resize 처럼 픽셀 모서리가 아닌 픽셀 중심을 맞추도록 보정
+    # (dst = s * src + (s - 1) / 2)
+    rotation_matrix[0, 2] += (scale_x - 1) / 2
+    rotation_matrix[1, 2] += (scale_y - 1) / 2
+    
+    # 회전 + 크기 조정된 이미지 계산
+    resized = cv2.warpAffine(image, rotation_matrix, output_size, 
                             flags=cv2.INTER_LINEAR, 
                             borderMode=cv2.BORDER_CONSTANT, 
                             borderValue=(0, 0, 0))
     
-    # 출력 크기로 조정
-    resized = cv2.resize(rotated, output_size, interpolation=cv2.INTER_LINEAR)
-    
     return resized
@@ -6,10 +6,12 @@ This script installs and configures the ViZDoom client.
 
 import os
 import sys
+import argparse
 import shutil
 import subprocess
 import platform
 import venv
+import tempfile
 from pathlib import Path
 
 # Directory information
@@ -17,13 +19,45 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CLIENT_DIR = os.path.join(SCRIPT_DIR, "client_files")
 VENV_DIR = os.path.join(SCRIPT_DIR, "venv")
 
+# Python packages required by the client
+PACKAGES = [
+    "numpy",
+    "opencv-python",
+    "matplotlib",
+    "vizdoom",
+    "pillow",
+    "requests",
+    "webdataset",
+]
+
+# Seconds to wait for the background wheel download once it is needed
+DOWNLOAD_TIMEOUT = 300
+
 
 def print_header(message):
     """Print header message"""
     print("\n" + "=" * 10 + " " + message + " " + "=" * 10)
 
 
-def install_system_deps():
+def confirm(answer=None):
+    """Read a y/n answer from the user
+
+    A preset answer (from a command line flag) is used without prompting.
+    Otherwise the answer is read from stdin, so piped answers such as
+    `yes | python install.py` keep working; end of input counts as "no" so
+    scripted runs never block.
+    """
+    if answer is not None:
+        print("y" if answer else "n")
+        return answer
+    try:
+        return input().lower() == "y"
+    except EOFError:
+        print("n (no input)")
+        return False
+
+
+def install_system_deps(assume_yes=False):
     """Install system dependencies"""
     if platform.system() == "Darwin":  # macOS
         print_header("macOS Detected")
@@ -35,7 +69,7 @@ def install_system_deps():
         )
         if brew_cmd.returncode != 0:
             print("Homebrew not found. Would you like to install it? (y/n)")
-            if input().lower() == "y":
+            if confirm(True if assume_yes else None):
                 # Install Homebrew
                 brew_install_cmd = "curl -fsSL https://raw.githubusercontent.com/Homebrew/install/master/install.sh"
                 subprocess.run(["/bin/bash", "-c", brew_install_cmd], check=True)
@@ -52,32 +86,68 @@ def install_system_deps():
         )
 
 
-def setup_virtual_env():
-    """Setup Python virtual environment"""
+def get_venv_paths():
+    """Return the Python and pip executables of the virtual environment"""
+    if platform.system() == "Windows":
+        venv_python = os.path.join(VENV_DIR, "Scripts", "python.exe")
+        venv_pip = os.path.join(VENV_DIR, "Scripts", "pip.exe")
+    else:  # Unix-based systems (Linux and macOS)
+        venv_python = os.path.join(VENV_DIR, "bin", "python")
+        venv_pip = os.path.join(VENV_DIR, "bin", "pip")
+    return venv_python, venv_pip
+
+
+def venv_matches_current_python(venv_python):
+    """Check whether the venv interpreter has the running Python's version"""
+    if not os.path.exists(venv_python):
+        return False
+    try:
+        output = subprocess.check_output(
+            [venv_python, "-c", "import sys; print(sys.version_info[:2])"]
+        )
+    except Exception:
+        return False
+    return output.decode().strip() == str(sys.version_info[:2])
+
+
+def setup_virtual_env(recreate=False, assume_yes=False):
+    """Setup Python virtual environment
+
+    Args:
+        recreate: Rebuild an existing venv even when its Python version
+            matches (e.g. to repair a broken one)
+        assume_yes: Rebuild a venv whose Python version differs without
+            asking
+    """
     print_header("Setting Up Python Virtual Environment")
 
+    venv_python, venv_pip = get_venv_paths()
+
     # Check if virtual environment already exists
     if os.path.exists(VENV_DIR):
         print(f"Virtual environment already exists at {VENV_DIR}")
-        print("Would you like to recreate it? (y/n)")
-        if input().lower() == "y":
-            print("Removing existing virtual environment...")
+
+        if recreate:
+            print("Recreating it as requested...")
             shutil.rmtree(VENV_DIR)
-        else:
+        elif venv_matches_current_python(venv_python):
+            # Reuse it without asking when it was built for this Python version
             print("Using existing virtual environment.")
-            return
+            return venv_python, venv_pip
+        else:
+            print("Its Python version differs from the current one.")
+            print("Would you like to recreate it? (y/n)")
+            if confirm(True if assume_yes else None):
+                print("Removing existing virtual environment...")
+                shutil.rmtree(VENV_DIR)
+            else:
+                print("Using existing virtual environment.")
+                return venv_python, venv_pip
 
-    # Create virtual environment
+    # Create virtual environment (symlink the interpreter instead of copying
+    # it where the platform allows)
     print(f"Creating virtual environment at {VENV_DIR}...")
-    venv.create(VENV_DIR, with_pip=True)
-
-    # Get the path to the Python executable in the virtual environment
-    if platform.system() == "Windows":
-        venv_python = os.path.join(VENV_DIR, "Scripts", "python.exe")
-        venv_pip = os.path.join(VENV_DIR, "Scripts", "pip.exe")
-    else:  # Unix-based systems (Linux and macOS)
-        venv_python = os.path.join(VENV_DIR, "bin", "python")
-        venv_pip = os.path.join(VENV_DIR, "bin", "pip")
+    venv.create(VENV_DIR, with_pip=True, symlinks=platform.system() != "Windows")
 
     # Upgrade pip within the virtual environment
     print("Upgrading pip in virtual environment...")
@@ -88,30 +158,92 @@ def setup_virtual_env():
     return venv_python, venv_pip
 
 
-def install_python_deps(venv_pip=None):
+def start_package_download(download_dir):
+    """Start downloading package wheels in the background
+
+    Runs while system packages and the virtual environment are being set up,
+    so the later install finds most wheels locally. Returns the pip process,
+    or None if it could not be started.
+    """
+    try:
+        return subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "download",
+                "--disable-pip-version-check",
+                "--no-input",
+                "--quiet",
+                "-d",
+                download_dir,
+                *PACKAGES,
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except Exception as e:
+        print(f"Could not start package download: {e}")
+        return None
+
+
+def finish_package_download(download):
+    """Wait for the background download started by start_package_download
+
+    Returns True if it finished in time. On timeout the download is stopped,
+    so the install falls back to fetching packages from the index.
+    """
+    print("Waiting for package download to finish...")
+    try:
+        download.wait(timeout=DOWNLOAD_TIMEOUT)
+        return True
+    except subprocess.TimeoutExpired:
+        print("Package download timed out, installing from the package index")
+        stop_package_download(download)
+        return False
+
+
+def stop_package_download(download):
+    """Stop the background download if it is still running"""
+    if download is None or download.poll() is not None:
+        return
+    download.terminate()
+    try:
+        download.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        download.kill()
+        download.wait()
+
+
+def install_python_deps(venv_pip=None, find_links=None):
     """Install Python packages"""
     print_header("Installing Python Packages")
 
     # Use virtualenv pip if available, otherwise use system pip
-    pip_cmd = venv_pip if venv_pip else [sys.executable, "-m", "pip"]
+    pip_cmd = [venv_pip] if venv_pip else [sys.executable, "-m", "pip"]
+    pip_install = pip_cmd + ["install", "--disable-pip-version-check", "--no-input"]
+    if find_links:
+        # Prefer prefetched wheels; anything missing still comes from PyPI
+        pip_install += ["--find-links", find_links]
 
     # Install required packages
-    packages = [
-        "numpy",
-        "opencv-python",
-        "matplotlib",
-        "vizdoom",
-        "pillow",
-        "requests",
-        "webdataset",
-    ]
+    packages = PACKAGES
+
+    # Install everything in one pip run so the resolver starts only once
+    print(f"Installing {', '.join(packages)}...")
+    try:
+        subprocess.run(pip_install + packages, check=True)
+        return
+    except Exception as e:
+        print(f"Error installing packages together: {e}")
+        print("Retrying one package at a time...")
+
+    # Fall back to per-package installs to find which package fails
     for pkg in packages:
         print(f"Installing {pkg}...")
         try:
-            if isinstance(pip_cmd, list):
-                subprocess.run(pip_cmd + ["install", pkg], check=True)
-            else:
-                subprocess.run([pip_cmd, "install", pkg], check=True)
+            subprocess.run(pip_install + [pkg], check=True)
         except Exception as e:
             print(f"Error installing {pkg}: {e}")
             print(f"Continuing. Please install {pkg} manually later.")
@@ -123,11 +255,24 @@ def set_permissions():
 
     # Set execution permissions on Unix-based systems
     if platform.system() != "Windows":
-        client_path = os.path.join(CLIENT_DIR, "client.py")
-        if os.path.exists(client_path):
-            print(f"Setting execution permissions for {client_path}...")
-            os.chmod(client_path, 0o755)
-        else:
+        # One directory pass; only chmod scripts whose mode actually differs
+        desired = 0o755
+        found_client = False
+        if os.path.isdir(CLIENT_DIR):
+            with os.scandir(CLIENT_DIR) as entries:
+                for entry in entries:
+                    if not entry.name.endswith((".py", ".sh")):
+                        continue
+                    if not entry.is_file():
+                        continue
+                    if entry.name == "client.py":
+                        found_client = True
+                    if (entry.stat().st_mode & 0o777) != desired:
+                        print(f"Setting execution permissions for {entry.path}...")
+                        os.chmod(entry.path, desired)
+
+        if not found_client:
+            client_path = os.path.join(CLIENT_DIR, "client.py")
             print(f"Warning: File {client_path} not found")
 
 
@@ -158,8 +303,13 @@ def create_run_script():
         print(f"Created run script at {run_script_path}")
 
 
-def run_client(venv_python=None):
-    """Run the client"""
+def run_client(venv_python=None, run=None):
+    """Run the client
+
+    Args:
+        venv_python: Python executable to run the client with
+        run: Whether to start the client (None asks the user)
+    """
     print_header("Run ViZDoom Client")
 
     python_cmd = venv_python if venv_python else sys.executable
@@ -167,34 +317,95 @@ def run_client(venv_python=None):
 
     if os.path.exists(client_path):
         print("Would you like to run the client now? (y/n)")
-        if input().lower() == "y":
+        if confirm(run):
+            if isinstance(python_cmd, list):
+                cmd = python_cmd + ["client.py"]
+            else:
+                cmd = [python_cmd, "client.py"]
             try:
                 os.chdir(CLIENT_DIR)
-                if isinstance(python_cmd, list):
-                    subprocess.run(python_cmd + ["client.py"], check=True)
-                else:
-                    subprocess.run([python_cmd, "client.py"], check=True)
+                if platform.system() != "Windows":
+                    # Last step: replace the installer process with the client
+                    # instead of forking and keeping the installer resident
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                    os.execvp(cmd[0], cmd)
+                subprocess.run(cmd, check=True)
             except Exception as e:
                 print(f"Error running client: {e}")
     else:
         print(f"Error: File {client_path} not found")
 
 
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="ViZDoom client installer")
+    parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        help="Answer yes to all prompts",
+    )
+    parser.add_argument(
+        "--run",
+        dest="run",
+        action="store_const",
+        const=True,
+        default=None,
+        help="Run the client after installing",
+    )
+    parser.add_argument(
+        "--no-run",
+        dest="run",
+        action="store_const",
+        const=False,
+        help="Do not run the client after installing",
+    )
+    parser.add_argument(
+        "--recreate-venv",
+        action="store_true",
+        help="Delete and rebuild an existing virtual environment, even one "
+        "built for the current Python version",
+    )
+    args = parser.parse_args()
+
+    # --yes answers every prompt that has no more specific flag
+    if args.yes and args.run is None:
+        args.run = True
+    return args
+
+
 def main():
     """Main installation process"""
+    args = parse_args()
+
     print("===== ViZDoom Client Installation Script =====")
     print("This script will set up everything you need to run the ViZDoom client.")
     print(f"Operating System: {platform.system()} {platform.release()}")
     print(f"Python Version: {platform.python_version()}")
 
-    # Install system packages
-    install_system_deps()
+    # Fetch package wheels while system packages and the venv are set up
+    download_dir = tempfile.mkdtemp(prefix="vizdoom_wheels_")
+    download = start_package_download(download_dir)
 
-    # Setup virtual environment
-    venv_python, venv_pip = setup_virtual_env()
+    try:
+        # Install system packages
+        install_system_deps(assume_yes=args.yes)
+
+        # Setup virtual environment
+        venv_python, venv_pip = setup_virtual_env(
+            recreate=args.recreate_venv, assume_yes=args.yes
+        )
 
-    # Install Python packages in the virtual environment
-    install_python_deps(venv_pip)
+        # Install Python packages in the virtual environment
+        find_links = None
+        if download is not None and finish_package_download(download):
+            find_links = download_dir
+        install_python_deps(venv_pip, find_links=find_links)
+    finally:
+        # Do not leave pip or the wheel directory behind on errors or Ctrl-C
+        stop_package_download(download)
+        shutil.rmtree(download_dir, ignore_errors=True)
 
     # Set execution permissions
     set_permissions()
@@ -222,7 +433,7 @@ def main():
         print("./run_client.sh")
 
     # Run client
-    run_client(venv_python)
+    run_client(venv_python, run=args.run)
 
 
 if __name__ == "__main__":
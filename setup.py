@@ -3,6 +3,8 @@ import sys
 import shutil
 import subprocess
 import platform
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 print("===== ViZDoom 클라이언트 Python 설치 스크립트 =====")
 print("이 스크립트는 ViZDoom 클라이언트에 필요한 Python 패키지를 설치합니다.")
@@ -40,9 +42,19 @@ def install_requirements():
             "requests",
         ]
 
-        for pkg in requirements:
-            print(f"설치 중: {pkg}")
-            subprocess.check_call([sys.executable, "-m", "pip", "install", pkg])
+        # 한 번의 pip 실행으로 모두 설치 (의존성 해석기를 한 번만 실행)
+        print(f"설치 중: {', '.join(requirements)}")
+        subprocess.check_call(
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "install",
+                "--disable-pip-version-check",
+                "--no-input",
+                *requirements,
+            ]
+        )
 
         print("모든 Python 패키지가 성공적으로 설치되었습니다!")
         return True
@@ -65,20 +77,41 @@ def copy_client_files():
         "_vizdoom.ini",
     ]
 
-    for file in client_files:
-        src_path = os.path.join(SCRIPT_DIR, file)
-        dst_path = os.path.join(CLIENT_DIR, file)
-
-        if os.path.exists(src_path):
-            shutil.copy2(src_path, dst_path)
-            print(f"복사 완료: {file}")
-        else:
-            print(f"경고: {file} 파일을 찾을 수 없습니다")
-
-    # 실행 가능하게 설정
-    client_script = os.path.join(CLIENT_DIR, "client.py")
-    if os.path.exists(client_script):
-        os.chmod(client_script, 0o755)  # 실행 권한 추가
+    # 파일마다 존재 여부를 확인하지 않고 디렉토리를 한 번만 읽어 있는 파일을 찾음
+    wanted = set(client_files)
+    with os.scandir(SCRIPT_DIR) as entries:
+        present = {
+            entry.name: entry.path
+            for entry in entries
+            if entry.name in wanted and entry.is_file()
+        }
+
+    # 대상 경로 접두사는 한 번만 만들고 파일 이름만 이어 붙임
+    dst_prefix = os.path.join(CLIENT_DIR, "")
+
+    def copy_file(file):
+        src_path = present.get(file)
+        if src_path is None:
+            return f"경고: {file} 파일을 찾을 수 없습니다"
+
+        shutil.copy2(src_path, dst_prefix + file)
+        return f"복사 완료: {file}"
+
+    # 파일들을 동시에 복사 (shutil.copy2 는 커널 복사 경로를 사용하고
+    # 복사 중에는 GIL 을 놓으므로 WAD 파일 복사가 서로 겹쳐 진행됨)
+    with ThreadPoolExecutor(max_workers=len(client_files)) as executor:
+        # 결과는 목록 순서대로 출력
+        for message in executor.map(copy_file, client_files):
+            print(message)
+
+    # 실행 가능하게 설정 (디렉토리를 한 번 훑어 권한이 다른 스크립트만 변경)
+    desired = 0o755
+    with os.scandir(CLIENT_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith((".py", ".sh")) or not entry.is_file():
+                continue
+            if (entry.stat().st_mode & 0o777) != desired:
+                os.chmod(entry.path, desired)  # 실행 권한 추가
 
 
 def run_client():
@@ -88,16 +121,70 @@ def run_client():
     client_script = os.path.join(CLIENT_DIR, "client.py")
     if os.path.exists(client_script):
         os.chdir(CLIENT_DIR)
+        cmd = [sys.executable, client_script]
         try:
-            subprocess.call([sys.executable, client_script])
+            if platform.system() != "Windows":
+                # 마지막 단계이므로 설치 프로세스를 클라이언트로 교체 (fork 없이 실행)
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os.execv(cmd[0], cmd)
+            subprocess.call(cmd)
         except Exception as e:
             print(f"클라이언트 실행 중 오류 발생: {e}")
     else:
         print(f"오류: {client_script} 파일을 찾을 수 없습니다")
 
 
+def confirm(prompt, answer=None):
+    """y/n 응답 확인
+
+    명령줄 옵션으로 정해진 응답이 있으면 묻지 않고 사용하고, 그 외에는 표준
+    입력에서 읽으므로 `yes | python setup.py` 처럼 파이프로 넘긴 응답도
+    동작합니다. 입력이 끝나면 (EOF) 멈추지 않도록 "n" 으로 처리합니다.
+    """
+    if answer is not None:
+        print(prompt + ("y" if answer else "n"))
+        return answer
+    try:
+        return input(prompt).lower() == "y"
+    except EOFError:
+        print("n (입력 없음)")
+        return False
+
+
+def parse_args():
+    """명령줄 옵션 해석"""
+    parser = argparse.ArgumentParser(description="ViZDoom 클라이언트 설치 스크립트")
+    parser.add_argument(
+        "-y", "--yes", action="store_true", help="모든 질문에 y 로 응답"
+    )
+    parser.add_argument(
+        "--run",
+        dest="run",
+        action="store_const",
+        const=True,
+        default=None,
+        help="설치 후 클라이언트 실행",
+    )
+    parser.add_argument(
+        "--no-run",
+        dest="run",
+        action="store_const",
+        const=False,
+        help="설치 후 클라이언트를 실행하지 않음",
+    )
+    args = parser.parse_args()
+
+    # --yes 는 더 구체적인 옵션이 없는 모든 질문에 적용
+    if args.yes and args.run is None:
+        args.run = True
+    return args
+
+
 def main():
     """메인 실행 함수"""
+    args = parse_args()
+
     # 시스템 정보 출력
     print(f"운영체제: {platform.system()} {platform.release()}")
     print(f"Python 버전: {platform.python_version()}")
@@ -108,8 +195,10 @@ def main():
         print("ViZDoom이 제대로 작동하려면 Homebrew로 다음 패키지를 설치해야 합니다:")
         print("  brew install cmake boost sdl2 wget")
 
-        response = input("Homebrew로 필요한 패키지를 설치하시겠습니까? (y/n): ")
-        if response.lower() == "y":
+        if confirm(
+            "Homebrew로 필요한 패키지를 설치하시겠습니까? (y/n): ",
+            True if args.yes else None,
+        ):
             try:
                 # Homebrew 설치 확인
                 brew_exists = (
@@ -145,8 +234,7 @@ def main():
     print(f"cd {CLIENT_DIR} && python client.py")
 
     # 실행 옵션 제공
-    response = input("\n지금 클라이언트를 실행하시겠습니까? (y/n): ")
-    if response.lower() == "y":
+    if confirm("\n지금 클라이언트를 실행하시겠습니까? (y/n): ", args.run):
         run_client()
 
 
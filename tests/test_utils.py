@@ -0,0 +1,204 @@
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+pytest.importorskip("vizdoom")
+pytest.importorskip("webdataset")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "client_files"))
+
+from utils import (  # noqa: E402
+    draw_esp_overlay,
+    get_all_objects_info,
+    rotate_and_resize,
+    world_to_screen,
+)
+
+
+def smooth_image(width=321, height=241):
+    """Smooth 3-channel test image (odd sizes so w // 2 is the exact center)"""
+    y, x = np.mgrid[0:height, 0:width]
+    gray = 127 + 60 * np.sin(x / 17.0) + 60 * np.cos(y / 13.0)
+    return np.dstack([gray.astype(np.uint8)] * 3)
+
+
+def rotate_then_resize(image, angle, output_size):
+    """Two-step rotate + cv2.resize path rotate_and_resize replaces"""
+    h, w = image.shape[:2]
+    matrix = cv2.getRotationMatrix2D((w // 2, h // 2), -angle, 1.0)
+    rotated = cv2.warpAffine(
+        image,
+        matrix,
+        (w, h),
+        flags=cv2.INTER_LINEAR,
+        borderMode=cv2.BORDER_CONSTANT,
+        borderValue=(0, 0, 0),
+    )
+    return cv2.resize(rotated, output_size)
+
+
+def test_identity_keeps_image():
+    image = smooth_image()
+    out = rotate_and_resize(image, 0, output_size=(321, 241))
+    np.testing.assert_array_equal(out, image)
+
+
+def test_half_turn_flips_image():
+    image = smooth_image()
+    out = rotate_and_resize(image, 180, output_size=(321, 241))
+    np.testing.assert_array_equal(out, image[::-1, ::-1])
+
+
+@pytest.mark.parametrize("output_size", [(160, 120), (360, 360), (640, 480)])
+def test_no_rotation_matches_resize(output_size):
+    image = smooth_image()
+    out = rotate_and_resize(image, 0, output_size=output_size)
+    expected = cv2.resize(image, output_size)
+    # Pixel centers line up with cv2.resize; the outermost row/column can
+    # differ since warpAffine blends in the constant border when upscaling
+    diff = np.abs(out.astype(int) - expected.astype(int))[2:-2, 2:-2]
+    assert diff.max() <= 1
+
+
+@pytest.mark.parametrize("output_size", [(160, 120), (360, 360)])
+def test_rotation_close_to_two_step_path(output_size):
+    image = smooth_image()
+    out = rotate_and_resize(image, 30, output_size=output_size)
+    expected = rotate_then_resize(image, 30, output_size)
+    # One interpolation instead of two, so only small differences remain
+    # away from the rotated image edges
+    diff = np.abs(out.astype(float) - expected.astype(float))
+    assert out.shape == expected.shape
+    assert diff.mean() < 1.0
+
+
+class StubObject:
+    """Minimal stand-in for a ViZDoom object"""
+
+    def __init__(self, obj_id, name, x, y, z=0.0, health=100, obj_type=0):
+        self.id = obj_id
+        self.name = name
+        self.position_x = x
+        self.position_y = y
+        self.position_z = z
+        self.angle = 0.0
+        self.pitch = 0.0
+        self.health = health
+        self.type = obj_type
+
+
+class MalformedObject:
+    """Object whose position cannot be read"""
+
+    id = 99
+    name = "ZombieMan"
+    angle = 0.0
+    pitch = 0.0
+    type = 0
+
+
+def stub_objects():
+    return [
+        StubObject(1, "ZombieMan", 300.0, 40.0),
+        StubObject(2, "Clip", 50.0, 0.0, obj_type=1),  # item
+        StubObject(3, "DoomImp", 120.0, -30.0),
+        StubObject(4, "Column", 80.0, 10.0),  # not an enemy
+        StubObject(5, "StealthZombieMan", 0.0, 120.0),  # ties with id 6
+        StubObject(6, "Demon", 120.0, 0.0, health=0),  # dead, still listed
+        StubObject(7, "Cacodemon", 900.0, 500.0),
+    ]
+
+
+def baseline_enemy_order(objects, player_x, player_y):
+    """Filtering and distance ordering of the original implementation"""
+    enemy_names = ("ZombieMan", "DoomImp", "Demon", "Cacodemon", "DoomPlayer")
+    enemies = []
+    for obj in objects:
+        if obj.type == 1:
+            continue
+        if any(enemy in obj.name for enemy in enemy_names):
+            distance = math.sqrt(
+                (obj.position_x - player_x) ** 2 + (obj.position_y - player_y) ** 2
+            )
+            enemies.append((distance, obj.id))
+    enemies.sort(key=lambda item: item[0])
+    return [obj_id for _, obj_id in enemies]
+
+
+def test_objects_info_matches_baseline_order():
+    objects = stub_objects()
+    info = get_all_objects_info(objects, 0.0, 0.0)
+    assert [obj["id"] for obj in info] == baseline_enemy_order(objects, 0.0, 0.0)
+    assert info[[obj["id"] for obj in info].index(6)]["is_dead"]
+
+
+def test_objects_info_skips_malformed_object():
+    objects = stub_objects()
+    objects.insert(2, MalformedObject())
+    info = get_all_objects_info(objects, 0.0, 0.0)
+    assert [obj["id"] for obj in info] == baseline_enemy_order(
+        stub_objects(), 0.0, 0.0
+    )
+
+
+def full_frame_overlay(frame, player_pos, angle, pitch, objects_info):
+    """Original full-frame overlay: draw on a copy and blend the whole frame"""
+    height, width = frame.shape[:2]
+    overlay = frame.copy()
+    color = (255, 0, 0)
+    for obj in objects_info:
+        if obj.get("is_dead", False) or obj.get("health", 100) <= 0:
+            continue
+        screen_pos = world_to_screen(
+            *player_pos, angle, pitch, *obj["position"], width, height, fov_deg=90.0
+        )
+        if screen_pos is None:
+            continue
+        sx, sy = screen_pos
+        distance = obj["distance"]
+        size = max(3, int(80 / (1 + distance / 200)))
+        status_text = f" HP:{obj['health']}" if "health" in obj else ""
+        cv2.circle(overlay, (sx, sy), size, color, 2)
+        cv2.putText(
+            overlay,
+            f"{distance:.0f}" + status_text,
+            (sx - 20, sy - size - 5),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.5,
+            color,
+            1,
+        )
+        cv2.putText(
+            overlay,
+            f"{obj['name']}",
+            (sx - 20, sy + size + 15),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.5,
+            color,
+            1,
+        )
+    cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+    return frame
+
+
+def test_roi_overlay_matches_full_frame_blend():
+    frame = smooth_image(640, 480)
+    objects_info = get_all_objects_info(stub_objects(), 0.0, 0.0)
+    player_pos = (0.0, 0.0, 0.0)
+
+    expected = full_frame_overlay(frame.copy(), player_pos, 0.0, 0.0, objects_info)
+    out = draw_esp_overlay(frame.copy(), player_pos, 0.0, 0.0, objects_info)
+
+    assert not np.array_equal(out, frame)  # something was drawn
+    np.testing.assert_array_equal(out, expected)
+
+
+def test_overlay_without_live_objects_leaves_frame():
+    frame = smooth_image(640, 480)
+    dead = [{"position": (100.0, 0.0, 0.0), "distance": 100.0, "is_dead": True}]
+    out = draw_esp_overlay(frame.copy(), (0.0, 0.0, 0.0), 0.0, 0.0, dead)
+    np.testing.assert_array_equal(out, frame)